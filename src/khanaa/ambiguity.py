@@ -1,7 +1,18 @@
 """This module stores functions that check syllable's ambiguity."""
 
-from khanaa.thai_script import CONSONANTS, DIACRITICS, VOWELS
+from functools import lru_cache
+from typing import Dict, Optional
 
+from khanaa.thai_script import CONSONANT_SOUND_CODA, DIACRITICS, VOWELS
+
+NOT_DONEE_END_VOWELS: frozenset = frozenset({'อๅ'})
+PLAIN_HIDE_STYLES: frozenset = frozenset({'plain', 'hide'})
+JW_SOUNDS: frozenset = frozenset({'j', 'w'})
+JW_CHARS: frozenset = frozenset('ยว')
+NOT_DONOR_START_CHARS: frozenset = frozenset('หฮ')
+MAI_TAIKHUU: str = DIACRITICS['mai_taikhuu']
+
+@lru_cache(maxsize=4096)
 def find_donee_end(vowel: str, silent_before: str, coda: str,
         silent_after: str, silent_before_style: str,
         silent_after_style: str) -> bool:
@@ -11,10 +22,11 @@ def find_donee_end(vowel: str, silent_before: str, coda: str,
             and not coda
             and (not silent_before or silent_before_style == 'hide')
             and (not silent_after or silent_after_style == 'hide')
-            and vowel not in ['อๅ']):
+            and vowel not in NOT_DONEE_END_VOWELS):
         is_donee_end = True
     return is_donee_end
 
+@lru_cache(maxsize=4096)
 def find_donor_end(vowel: str, silent_before: str, coda: str,
         silent_after: str, silent_before_style: str,
         silent_after_style: str, tone_mark: str,
@@ -34,37 +46,44 @@ def find_donor_end(vowel: str, silent_before: str, coda: str,
         is_donor_end = True
     return is_donor_end
 
+@lru_cache(maxsize=4096)
 def find_donor_end_coda(vowel: str, vowel_form: str, tone_mark: str) -> bool:
-    return (VOWELS[vowel]['form_no_coda'] == VOWELS[vowel]['form_with_coda']
-        or (DIACRITICS['mai_taikhuu'] in VOWELS[vowel]['form_with_coda']
-            and VOWELS[VOWELS[vowel]['pair']]['form_no_coda']
-                == VOWELS[vowel]['form_with_coda'].replace(
-                    DIACRITICS['mai_taikhuu'], '')
-            and tone_mark)
+    vowel_data: Dict[str, str] = VOWELS[vowel]
+    form_with_coda: str = vowel_data['form_with_coda']
+    return (vowel_data['form_no_coda'] == form_with_coda
+        or (MAI_TAIKHUU in form_with_coda
+            and VOWELS[vowel_data['pair']]['form_no_coda']
+                == form_with_coda.replace(MAI_TAIKHUU, '')
+            and bool(tone_mark))
         or vowel_form == '-+')
 
+@lru_cache(maxsize=4096)
 def find_donor_end_jw(vowel: str, silent_before: str,
-        silent_before_style: str, tone_mark: str):
-    return ((not silent_before or silent_before_style in ['plain', 'hide'])
-        and VOWELS[vowel]['sound_coda'] in ['j', 'w']
-        and vowel[-1] in ['ย', 'ว']
-        and (DIACRITICS['mai_taikhuu'] not in vowel
-            or tone_mark)
-        and vowel[:-1].replace(DIACRITICS['mai_taikhuu'], '')
-            in VOWELS
-        and (VOWELS[vowel[:-1].replace(
-                DIACRITICS['mai_taikhuu'], '')]['form_no_coda']
-            == VOWELS[vowel[:-1].replace(
-                DIACRITICS['mai_taikhuu'], '')]['form_with_coda']
-            or vowel[:-1].replace(DIACRITICS['mai_taikhuu'], '')
-                == 'เออ'))
+        silent_before_style: str, tone_mark: str) -> bool:
+    if not ((not silent_before or silent_before_style in PLAIN_HIDE_STYLES)
+            and VOWELS[vowel]['sound_coda'] in JW_SOUNDS
+            and vowel[-1] in JW_CHARS
+            and (MAI_TAIKHUU not in vowel or tone_mark)):
+        return False
+    # vowel without its ย, ว coda, ex. เอีย from เอียว
+    stem: str = vowel[:-1].replace(MAI_TAIKHUU, '')
+    stem_data: Optional[Dict[str, str]] = VOWELS.get(stem)
+    return bool(stem_data
+        and (stem_data['form_no_coda'] == stem_data['form_with_coda']
+            or stem == 'เออ'))
 
 def find_donor_start(onset: str, form: str) -> bool:
     """See details at Kham."""
+    # only the first character of form matters, so reduce the key
+    # before caching instead of caching every spelled form.
+    return _find_donor_start(len(onset) > 1, form[:1])
+
+@lru_cache(maxsize=4096)
+def _find_donor_start(multiple_onset: bool, first_char: str) -> bool:
     is_donor_start: bool = False
-    if (len(onset) > 1
-            and form[0] in CONSONANTS
-            and CONSONANTS[form[0]]['sound_coda']
-            and form[0] not in ['ห', 'ฮ']):
+    if (multiple_onset
+            and first_char in CONSONANT_SOUND_CODA
+            and CONSONANT_SOUND_CODA[first_char]
+            and first_char not in NOT_DONOR_START_CHARS):
         is_donor_start = True
-    return is_donor_start
\ No newline at end of file
+    return is_donor_start
@@ -1,82 +1,137 @@
 """This module contains class that combine word data with methods."""
 
-from typing import List
+from copy import copy
+from functools import cached_property, lru_cache
+from typing import Any, Dict, List, Optional
 
 from khanaa.ambiguity import find_donee_end, find_donor_end, find_donor_start
 from khanaa.homophone import find_homophone_product
 from khanaa.pronunciation import ThaiToIPA
 from khanaa.romanization import ipa_to_rtgs
-from khanaa.speller import combine
+from khanaa.speller import combine, combine_head
+from khanaa.utils import FrozenPref, _freeze_pref, _thaw_pref
 from khanaa.word import Word
 
 class Combination(Word):
     """Combine finding word data part from Word with methods.
     
     For information for each methods, see Kham.
+
+    Word data are not changed after init, so the computed
+    results are cached on the instance.
     """
-    _ipa_data: ThaiToIPA = None
-    
-    @property
+    @cached_property
     def form(self) -> str:
         """Return spelled form of the word."""
         return combine(self, self.pref)
+
+    @cached_property
+    def _form_head(self) -> str:
+        """Return the first character of the spelled form."""
+        if 'form' in self.__dict__:
+            return self.form[:1]
+        return combine_head(self)
     
-    @property
+    @cached_property
     def all_tone(self) -> List[str]:
         all_tone = []
         for n in range(5):
-            spell = Combination(self._onset, self._vowel, self._silent_before,
-                self._coda, self._silent_after, n, **self.pref)
+            spell = self._with_tone(n)
             if not spell._is_possible_tone:
                 all_tone.append('')
                 continue
             all_tone.append(spell.form)
         return all_tone
     
-    @property
+    def _with_tone(self, tone: int) -> 'Combination':
+        """Return a copy of this word with another tone.
+
+        Tone-independent data are shared with this word,
+        only tone data are found again. Word data are in slots, so the
+        instance __dict__ only holds cached_property results and all
+        of them are dropped.
+        """
+        spell = copy(self)
+        spell.__dict__.clear()
+        spell._assign_tone(tone)
+        return spell
+
+    @cached_property
     def ipa_data(self) -> ThaiToIPA:
-        if not self._ipa_data:
-            # it's _tone_realized not _tone
-            # because we want spelled word sound, not the input one.
-            self._ipa_data = ThaiToIPA(self._onset, self._vowel, self._silent_before,
-                self._coda, self._silent_after, self._tone_realized, **self.pref)
-        return self._ipa_data
+        # it's _tone_realized not _tone
+        # because we want spelled word sound, not the input one.
+        return ThaiToIPA(self._onset, self._vowel, self._silent_before,
+            self._coda, self._silent_after, self._tone_realized, **self.pref)
 
-    @property
+    @cached_property
     def reading(self) -> str:
         return self.ipa_data.convert()
     
-    @property
+    @cached_property
     def rtgs(self) -> str:
         return ipa_to_rtgs(self.ipa_data)
     
-    @property
+    @cached_property
     def is_donee_end(self) -> bool:
         return find_donee_end(self._vowel, self._silent_before, self._coda,
             self._silent_after, self.pref['silent_before_style'],
             self.pref['silent_after_style'])
     
-    @property
+    @cached_property
     def is_donor_end(self) -> bool:
         return find_donor_end(self._vowel, self._silent_before, self._coda,
             self._silent_after, self.pref['silent_before_style'],
             self.pref['silent_after_style'], self._tone_mark,
             self._vowel_form)
     
-    @property
+    @cached_property
     def is_donor_start(self) -> bool:
-        return find_donor_start(self._onset, self.form)
+        return find_donor_start(self._onset, self._form_head)
     
-    @property
+    @cached_property
     def homophone(self) -> list:
         product = find_homophone_product(self._onset, self._vowel, self._coda)
-        result = []
-        for possible in product:
-            kham = Combination(
-                onset=possible[0],
-                vowel=possible[1],
-                coda=possible[2],
-                tone=self._tone_realized
-            )
-            result.append(kham.form)
-        return list(dict.fromkeys(result))
\ No newline at end of file
+        # dict as an ordered set, duplicates are dropped while iterating
+        forms: Dict[str, None] = {}
+        for possible in dict.fromkeys(product):
+            forms.setdefault(homophone_form(*possible, self._tone_realized))
+        return list(forms)
+
+@lru_cache(maxsize=8192)
+def homophone_form(onset: str, vowel: str, coda: str, tone: int) -> str:
+    """Return spelled form of a homophone candidate (default pref)."""
+    return Combination(onset=onset, vowel=vowel, coda=coda, tone=tone).form
+
+def create_combination(
+        onset: str,
+        vowel: str,
+        silent_before: str = '',
+        coda: str = '',
+        silent_after: str = '',
+        tone: int = -1,
+        **pref: Any) -> Combination:
+    """Return Combination, reusing the one made from the same input.
+
+    Combination is not changed after init, so it is safe to share.
+    Fall back to a new Combination if pref can't be hashed.
+    """
+    pref_items: Optional[FrozenPref] = _freeze_pref(pref)
+    if pref_items is None:
+        return Combination(onset, vowel, silent_before, coda,
+            silent_after, tone, **pref)
+    return _cached_combination(onset, vowel, silent_before, coda,
+        silent_after, tone, pref_items)
+
+@lru_cache(maxsize=4096, typed=True)
+def _cached_combination(
+        onset: str,
+        vowel: str,
+        silent_before: str,
+        coda: str,
+        silent_after: str,
+        tone: int,
+        pref_items: FrozenPref) -> Combination:
+    """Create Combination from frozen pref made by create_combination."""
+    pref = _thaw_pref(pref_items)
+    return Combination(onset, vowel, silent_before, coda,
+        silent_after, tone, **pref)
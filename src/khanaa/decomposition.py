@@ -19,21 +19,31 @@ different form.
 """
 
 import re
-from typing import Any, Dict, List, Tuple, Union
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Tuple, Union
 
-from khanaa.thai_script import (CLUSTERS, CONSONANTS, DIACRITICS,
-    TONE_MARKERS, VOWEL_CHAR, VOWELS)
-from khanaa.word import Word
+from khanaa.thai_script import (CLUSTERS, CONSONANT_CLASS,
+    CONSONANT_SOUND_CODA, DIACRITICS, TONE_MARKERS, VOWEL_CHAR, VOWELS)
+from khanaa.word import (_find_is_h_vague, _find_is_low_single_vague,
+    _find_onset_index, _find_onset_main)
 from khanaa.utils import find_tone
 
+JW_SOUNDS: frozenset = frozenset({'j', 'w'})
+JW_CHARS: frozenset = frozenset('ยว')
+IU_CHARS: frozenset = frozenset('ิุ')
+CODA_VOWEL_TYPES: frozenset = frozenset({'vowel_coda', 'ex_coda'})
 TONE_MARK: str = ''.join([TONE_MARKERS[tone] for tone in TONE_MARKERS])
-CODA_LIST: str = ''.join([char for char in CONSONANTS
-    if CONSONANTS[char]['sound_coda']
-    and char not in ['ย', 'ว']])
-
-vowel_re = None
-# should be created once by create_vowel_re()
-# and after that its value won't be changed
+CODA_LIST: str = ''.join([char for char in CONSONANT_SOUND_CODA
+    if CONSONANT_SOUND_CODA[char]
+    and char not in JW_CHARS])
+TONE_MARK_SET: frozenset = frozenset(TONE_MARK)
+VOWEL_CHAR_SET: frozenset = frozenset(VOWEL_CHAR)
+THAI_CONSONANT_SET: frozenset = frozenset(
+    chr(code) for code in range(ord('ก'), ord('ฮ') + 1))
+TONE_MARK_STRIP = str.maketrans('', '', TONE_MARK)
+TONE_MARK_NAME: Dict[str, str] = {char: name
+    for name, char in TONE_MARKERS.items()}
+KAARAN: str = DIACRITICS['kaaran']
 
 def spelling_decompose(text: str) -> Union[Dict[str, Any], None]:
     """Find each part of the spelled word.
@@ -61,9 +71,6 @@ def spelling_decompose(text: str) -> Union[Dict[str, Any], None]:
     if not text:
         return
 
-    global vowel_re
-    if vowel_re == None:
-        vowel_re = create_vowel_re()
     pref = {}
 
     tone_mark = analyze_tone_mark(text)
@@ -100,11 +107,11 @@ def spelling_decompose(text: str) -> Union[Dict[str, Any], None]:
         pref.update({'vowel_coda_form': {new_vowel: new_form}})
 
     # find tone number
-    is_low_single_vague = Word._find_is_low_single_vague(True, onset)
-    is_h_vague = Word._find_is_h_vague(True, onset)
-    onset_index = Word._find_onset_index(is_low_single_vague,
+    is_low_single_vague = _find_is_low_single_vague(True, onset)
+    is_h_vague = _find_is_h_vague(True, onset)
+    onset_index = _find_onset_index(is_low_single_vague,
         is_h_vague, onset, False, False, False)
-    onset_main = Word._find_onset_main(onset, onset_index)
+    onset_main = _find_onset_main(onset, onset_index)
     tone = find_tone(onset_main, vowel, coda, tone_mark, leading_h)
 
     # ห+ต่ำเดี่ยว+ไม้โท
@@ -133,7 +140,7 @@ def replace_vowel_re(form: str) -> str:
     form = ''.join(['^[ก-ฮ]*', form])
     return form
 
-def create_vowel_re():
+def create_vowel_re() -> Dict[str, Dict[str, Dict[str, Any]]]:
     """Create vowel regular expression dict to be used.
 
     Returns:
@@ -149,19 +156,21 @@ def create_vowel_re():
         Each vowel type contains vowels sorted by vowel form length
         and each vowel contains:
             - 'form' for vowel form
+            - 'chars' for set of characters in vowel form
             - 're' for vowel regex
     """
     # find vowels for each vowel type because each vowel type will use
     # different regex
-    vowel_re = {'vowel_jw': {}, 'vowel_coda': {}, 'vowel_no_coda': {}}
+    vowel_re: Dict[str, Dict[str, Any]] = {
+        'vowel_jw': {}, 'vowel_coda': {}, 'vowel_no_coda': {}}
     for vowel in VOWELS:
         if (VOWELS[vowel]['form_no_coda']
-                and VOWELS[vowel]['sound_coda'] in ['j', 'w']):
+                and VOWELS[vowel]['sound_coda'] in JW_SOUNDS):
             vowel_re['vowel_jw'].update({vowel: VOWELS[vowel]['form_no_coda']})
         if VOWELS[vowel]['form_with_coda']:
             vowel_re['vowel_coda'].update({vowel: VOWELS[vowel]['form_with_coda']})
         if (VOWELS[vowel]['form_no_coda']
-                and VOWELS[vowel]['sound_coda'] not in ['j', 'w']):
+                and VOWELS[vowel]['sound_coda'] not in JW_SOUNDS):
             vowel_re['vowel_no_coda'].update({vowel: VOWELS[vowel]['form_no_coda']})
     
     # these vowels should come last because they're invisible
@@ -173,12 +182,14 @@ def create_vowel_re():
 
     # sort vowels and create regex for each vowel
     for vowel_type, vowel_data in vowel_re.items():
-        sorted_vowel = sorted(vowel_re[vowel_type],
-            key=lambda vowel: len(vowel_re[vowel_type][vowel]), reverse=True)
+        form_lengths = [(vowel, len(form))
+            for vowel, form in vowel_data.items()]
+        form_lengths.sort(key=lambda item: item[1], reverse=True)
+        sorted_vowel = [vowel for vowel, _ in form_lengths]
         additional = ''
         if vowel_type == 'vowel_jw':
             additional = f'(?![์{TONE_MARK}])'
-        elif vowel_type in ['vowel_coda', 'ex_coda']:
+        elif vowel_type in CODA_VOWEL_TYPES:
             additional = f'([ก-ฮ]+์)?[{CODA_LIST}](?![์{TONE_MARK}])'
         new_vowel_data = {}
         for vowel in sorted_vowel:
@@ -187,10 +198,36 @@ def create_vowel_re():
             new_vowel_data.update({
                 vowel: {
                     'form': vowel_data[vowel],
+                    'chars': frozenset(vowel_data[vowel]),
                     're': pattern}})
         vowel_re[vowel_type] = new_vowel_data
     return vowel_re
 
+def create_combined_vowel_re(
+        vowel_re: Dict[str, Dict[str, Any]]) -> Dict[str, Tuple[
+            re.Pattern, Tuple[str, ...]]]:
+    """Join every vowel regex of each vowel type into one alternation.
+
+    Args:
+        vowel_re: From create_vowel_re()
+
+    Returns:
+        Dict of vowel type containing the combined regex and its vowels
+        in the same order. The matched vowel index is the name of
+        the last matched group (g0, g1, ...) in the combined regex.
+    """
+    combined_re = {}
+    for vowel_type, vowel_data in vowel_re.items():
+        vowels = tuple(vowel_data)
+        pattern = '|'.join([f'(?P<g{index}>{vowel_data[vowel]["re"].pattern})'
+            for index, vowel in enumerate(vowels)])
+        combined_re[vowel_type] = (re.compile(pattern), vowels)
+    return combined_re
+
+VOWEL_RE = create_vowel_re()
+VOWEL_RE_COMBINED = create_combined_vowel_re(VOWEL_RE)
+# created once at import, their values won't be changed
+
 def split_silent_after(text: str) -> Tuple[str, str]:
     """Split silent after from the last position.
 
@@ -212,14 +249,21 @@ def split_silent_after(text: str) -> Tuple[str, str]:
     """
     no_silent_after: str = text
     silent_after: str = ''
-    if text[-1] == DIACRITICS['kaaran']:
-        result: List[str] = re.split(f'([ก-ฮ][{VOWEL_CHAR}]?์$)', text)
-        if len(result) > 1:
-            no_silent_after = result[0]
-            silent_after = result[1].replace('์', '')
+    if text[-1] == KAARAN:
+        # consonant (+ vowel char) + kaaran at the end of text
+        length: int = 0
+        if (len(text) > 2
+                and text[-2] in VOWEL_CHAR_SET
+                and text[-3] in THAI_CONSONANT_SET):
+            length = 3
+        elif len(text) > 1 and text[-2] in THAI_CONSONANT_SET:
+            length = 2
+        if length:
+            no_silent_after = text[:-length]
+            silent_after = text[-length:-1]
     return no_silent_after, silent_after
 
-def analyze_tone_mark(text: str):
+def analyze_tone_mark(text: str) -> str:
     """Find tone mark used.
 
     Args:
@@ -228,18 +272,15 @@ def analyze_tone_mark(text: str):
     Returns:
         Tone mark name
     """
-    tone_mark = ''
+    # most syllables have no tone mark, skip the search for them
+    if TONE_MARK_SET.isdisjoint(text):
+        return ''
+    # the first one in TONE_MARK order, as tone marks are difficult
+    # to see we'll return their names instead
     for char in TONE_MARK:
         if char in text:
-            tone_mark = char
-            break
-    # because tone marks are difficult to see
-    # we'll return their names instead
-    for name, tone_char in TONE_MARKERS.items():
-        if tone_mark == tone_char:
-            tone_mark = name
-            break
-    return tone_mark
+            return TONE_MARK_NAME[char]
+    return ''
 
 def analyze_vowel(text: str) -> Tuple[str, str, str, str, str]:
     """Find vowel in the word.
@@ -250,53 +291,66 @@ def analyze_vowel(text: str) -> Tuple[str, str, str, str, str]:
     Returns:
         vowel, silent_after, word without silent_after, vowel_type
     """
-    all_vowels: List[str] = [char for char in text if char in VOWEL_CHAR]
+    text_vowels: FrozenSet[str] = VOWEL_CHAR_SET.intersection(text)
     vowel, silent_after, no_silent_after, vowel_form = '', '', '', ''
-    for vowel_type in vowel_re:
-        result = analyze_vowel_form(text, all_vowels, vowel_type)
+    for vowel_type in VOWEL_RE:
+        result = analyze_vowel_form(text, text_vowels, vowel_type)
         if result[0]:
             vowel, silent_after, no_silent_after, vowel_form = result
             break
     return vowel, silent_after, no_silent_after, vowel_type, vowel_form
 
-def analyze_vowel_form(text: str, all_vowels: List[str],
+def analyze_vowel_form(text: str, text_vowels: FrozenSet[str],
         vowel_type: str) -> Tuple[str, str, str, str]:
     """Find vowel in the word from one vowel type.
 
     Args:
         text: One Thai syllable/word
-        vowel_type: From vowel_re
+        text_vowels: Vowel characters in text
+        vowel_type: From VOWEL_RE
 
     Returns:
         Vowel form if vowel is found. Empty string if not found.
     """
-    for vowel in vowel_re[vowel_type]:
-        form = vowel_re[vowel_type][vowel]['form']
-        pattern = vowel_re[vowel_type][vowel]['re']
-        result = re.search(pattern, text)
+    # the combined regex finds the first vowel that matches in one scan,
+    # so only vowels from there need to be checked one by one
+    combined_re, vowels = VOWEL_RE_COMBINED[vowel_type]
+    found = combined_re.search(text)
+    if not found:
+        return '', '', '', ''
+    for vowel in vowels[int(found.lastgroup[1:]):]:
+        form = VOWEL_RE[vowel_type][vowel]['form']
+        pattern = VOWEL_RE[vowel_type][vowel]['re']
+        result = pattern.search(text)
         if result:
             # To make sure every vowel char is taken into account.
             # Even if we order our search by vowel form length,
             # because we search vowel with ย, ว before other type
             # of vowel, the word like เปลี่ยน will be matched with
             # อีย before เอีย.
-            leftover = [char for char in all_vowels if char not in form]
+            leftover = text_vowels - VOWEL_RE[vowel_type][vowel]['chars']
             if leftover:
                 # for ญาติ, เหตุ
+                # (leftover is a set, so also check that its only char
+                # appears once)
+                char = next(iter(leftover))
                 if (len(leftover) == 1
-                        and leftover[0] in ['ิ', 'ุ']
-                        and text[-1] in ['ิ', 'ุ']):
+                        and char in IU_CHARS
+                        and text.count(char) == 1
+                        and text[-1] in IU_CHARS):
                     pass
                 else:
                     continue
-            split = re.split(pattern, text)
+            # patterns are anchored at the start, so the rest of text
+            # after the match is what re.split would leave last
+            rest = text[result.end():]
             silent_after = ''
-            if split[-1]:
+            if rest:
                 # แสวง should be สว+แอ+ง not ส+แอว+(ง)
                 if (vowel_type == 'vowel_jw'
-                        and split[-1].find(DIACRITICS['kaaran']) == -1):
+                        and rest.find(KAARAN) == -1):
                     continue
-                silent_after = split[-1].replace(DIACRITICS['kaaran'], '')
+                silent_after = rest.replace(KAARAN, '')
             return vowel, silent_after, result[0], form
     return '', '', '', ''
 
@@ -305,13 +359,13 @@ def analyze_coda(text: str, vowel_type: str) -> Tuple[str, str]:
 
     Args:
         text: Syllable without silent_after
-        vowel_type: From vowel_re
+        vowel_type: From VOWEL_RE
 
     Returns:
         coda, text without coda
     """
     coda = ''
-    if vowel_type in ['vowel_coda', 'ex_coda']:
+    if vowel_type in CODA_VOWEL_TYPES:
         coda = text[-1]
         text = text[:-1]
     return coda, text
@@ -325,9 +379,7 @@ def remove_tone(text: str) -> str:
     Returns:
         Thai syllable without tone mark.
     """
-    for char in TONE_MARK:
-        text = text.replace(char, '')
-    return text
+    return text.translate(TONE_MARK_STRIP)
 
 def analyze_onset(matched_text: str, vowel_form: str) -> Tuple[
         str, bool, str, str]:
@@ -342,20 +394,29 @@ def analyze_onset(matched_text: str, vowel_form: str) -> Tuple[
     """
     vowel_form = vowel_form.replace('+', '') # + is tone mark place
     char_before, char_after = vowel_form.split('-') # - is onset place
-    pattern = f'(?<={char_before})[ก-ฮ]+(?={char_after})(?!์)'
-    onset_back = re.search(re.compile(pattern), matched_text)[0]
+    onset_back = onset_back_re(char_before, char_after).search(
+        matched_text)[0]
     onset_back, leading_h = analyze_leading_h(onset_back)
 
     # check for onset before vowel such as ส from สเต็ก
     onset_front = ''
     if char_before:
-        pattern_front = f'^[ก-ฮ]+(?={char_before})'
-        found_onset = re.search(re.compile(pattern_front), matched_text)
+        found_onset = onset_front_re(char_before).search(matched_text)
         if found_onset:
             onset_front = found_onset[0]
     onset = ''.join([onset_front, onset_back])
     return onset, leading_h, onset_front, onset_back
 
+@lru_cache(maxsize=256)
+def onset_back_re(char_before: str, char_after: str) -> re.Pattern:
+    """Return compiled regex for onset between vowel chars."""
+    return re.compile(f'(?<={char_before})[ก-ฮ]+(?={char_after})(?!์)')
+
+@lru_cache(maxsize=256)
+def onset_front_re(char_before: str) -> re.Pattern:
+    """Return compiled regex for onset before front vowel."""
+    return re.compile(f'^[ก-ฮ]+(?={char_before})')
+
 def analyze_leading_h(onset: str) -> Tuple[str, bool]:
     """Find and separate ห นำ from onset.
 
@@ -368,7 +429,7 @@ def analyze_leading_h(onset: str) -> Tuple[str, bool]:
     leading_h: bool = False
     if ('ห' in onset
             and len(onset) > onset.index('ห')+1
-            and CONSONANTS[onset[onset.index('ห')+1]]['class']
+            and CONSONANT_CLASS[onset[onset.index('ห')+1]]
                 == 'low_single'):
         leading_h = True
         onset = onset.replace('ห', '')
@@ -421,7 +482,7 @@ def analyze_silent_before(text: str) -> str:
         silent_before
     """
     silent_before: str = ''
-    if text[-1] == DIACRITICS['kaaran']:
+    if text[-1] == KAARAN:
         silent_before = text[-2]
     return silent_before
 
@@ -1,6 +1,25 @@
+from collections import defaultdict
 from itertools import product
+from typing import Callable, Hashable, Mapping
 from khanaa.thai_script import CONSONANTS, VOWELS
 
+def _group_by(data: Mapping[str, Mapping[str, str]],
+        key: Callable[[Mapping[str, str]], Hashable]
+        ) -> dict[Hashable, tuple[str, ...]]:
+    """Group data keys that share the same key(data[item])."""
+    groups = defaultdict(list)
+    for item in data:
+        groups[key(data[item])].append(item)
+    return {sound: tuple(items) for sound, items in groups.items()}
+
+# same-sound buckets, built once as the tables never change
+_SAME_SOUND = {
+    "onset": _group_by(CONSONANTS, lambda con: con["sound_onset"]),
+    "coda": _group_by(CONSONANTS, lambda con: con["sound_coda"]),
+}
+_SAME_SOUND_VOWEL = _group_by(VOWELS, lambda v: (v["length"],
+    v["sound_vowel"], v["sound_coda"]))
+
 def find_same_sound_consonant(consonant: str, type: str) -> list[str]:
     """Find a list of consonants that have same sound as the input
 
@@ -11,16 +30,10 @@ def find_same_sound_consonant(consonant: str, type: str) -> list[str]:
     Returns:
         List of consonants (including the input)
     """
-    result = []
     if len(consonant) != 1:
-        return result
-    name: str = f"sound_{type}"
-    sound: str = CONSONANTS.get(consonant)[name]
-    for con in CONSONANTS:
-        if CONSONANTS[con][name] == sound:
-            result.append(con)
-    
-    return result
+        return []
+    sound: str = CONSONANTS.get(consonant)[f"sound_{type}"]
+    return list(_SAME_SOUND[type][sound])
 
 def find_same_sound_vowel(vowel: str) -> list[str]:
     """Find a list of vowels that have same sound as the input
@@ -31,19 +44,12 @@ def find_same_sound_vowel(vowel: str) -> list[str]:
     Returns:
         List of vowels (including the input)
     """
-    result = []
-    data: str = VOWELS.get(vowel)
-    for v in VOWELS:
-        v_data = VOWELS[v]
-        same_length: bool = data["length"] == v_data["length"]
-        same_sound_vowel: bool = data["sound_vowel"] == v_data["sound_vowel"]
-        same_sound_coda: bool = data["sound_coda"] == v_data["sound_coda"]
-        if same_length and same_sound_vowel and same_sound_coda:
-            result.append(v)
-    
-    return result
+    data: dict[str, str] = VOWELS.get(vowel)
+    return list(_SAME_SOUND_VOWEL[(data["length"], data["sound_vowel"],
+        data["sound_coda"])])
 
-def find_homophone_product(onset: str, vowel: str, coda: str):
+def find_homophone_product(onset: str, vowel: str,
+        coda: str) -> list[tuple[str, str, str]]:
     """Find a product of inputs' homophone
 
     Args:
@@ -1,8 +1,13 @@
 from typing import Any, List
 
-from khanaa.combination import Combination
+from khanaa.combination import Combination, create_combination
 from khanaa.thai_script import DIACRITICS
 
+# names exported by `from khanaa.main import *`
+__all__ = ['Kham', 'Combination', 'DIACRITICS']
+
+KAARAN: str = DIACRITICS['kaaran']
+
 class Kham:
     """Spell Thai word from information provided.
     
@@ -43,6 +48,13 @@ class Kham:
         all_tone (list[str]): Return 0-4 tone version of the word.
         homophone (list[str]): Return a list of homophone
     """
+    # word attributes in the order they appear in data
+    _ATTRIBUTES = ('onset', 'onset_index', 'onset_main', 'onset_class',
+        'vowel', 'vowel_length', 'silent_before', 'coda', 'coda_class',
+        'silent_after', 'tone', 'is_possible_tone', 'tone_realized',
+        'use_leading_h', 'use_pair_onset', 'tone_mark', 'is_checked',
+        'form')
+    __slots__ = ('_spell',) + _ATTRIBUTES
 
     def __init__(
             self,
@@ -190,7 +202,7 @@ class Kham:
                 (ex. ม+อะ+น+2=หมั้น)
                 Default: False
         """
-        self._spell = Combination(onset, vowel, silent_before, coda,
+        self._spell = create_combination(onset, vowel, silent_before, coda,
             silent_after, tone, **pref)
         self.onset: str = self._spell._onset
         self.onset_index: int = self._spell._onset_index
@@ -213,18 +225,13 @@ class Kham:
         self.form = self._spell.form
 
     def __repr__(self) -> str:
-        letters = [self.onset, self.vowel]
-        if self.silent_before:
-            letters.append(self.silent_before + DIACRITICS['kaaran'])
-        if self.coda:
-            letters.append(self.coda)
-        if self.silent_after:
-            letters.append(self.silent_after + DIACRITICS['kaaran'])
-
-        letters.append(str(self.tone))
-        letter_phrase = '+'.join(letters)
-
-        return repr(' '.join([self.form, '=', letter_phrase]))
+        silent_before = (f'+{self.silent_before}{KAARAN}'
+            if self.silent_before else '')
+        coda = f'+{self.coda}' if self.coda else ''
+        silent_after = (f'+{self.silent_after}{KAARAN}'
+            if self.silent_after else '')
+        return repr(f'{self.form} = {self.onset}+{self.vowel}'
+            f'{silent_before}{coda}{silent_after}+{self.tone}')
 
     def ipa(self) -> str:
         """Return basic IPA pronunciation of the spelled syllable.
@@ -303,7 +310,7 @@ class Kham:
             possible with that tone.
             Ex. ['', 'กะ', 'ก้ะ', 'ก๊ะ', 'ก๋ะ']
         """
-        return self._spell.all_tone
+        return list(self._spell.all_tone)
     
     def homophone(self) -> List[str]:
         """Return a list of the word's homophone
@@ -312,12 +319,12 @@ class Kham:
             - The list also includes the original word
             - Silent characters are not included
         """
-        return self._spell.homophone
+        return list(self._spell.homophone)
     
     @property
     def data(self) -> dict[str, Any]:
-        result = {attr: self.__dict__[attr] for attr in self.__dict__}
-        result.pop("_spell")
+        """Return a new dict of the word data."""
+        result = {attr: getattr(self, attr) for attr in self._ATTRIBUTES}
         result.update({
             'ipa': self.ipa(),
             'rtgs': self.rtgs(),
@@ -1,14 +1,47 @@
 """This module contains class used to derive word pronunciation."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, NamedTuple
 
-from khanaa.thai_script import (CLUSTERS, CONSONANTS, FALSE_CLUSTERS, VOWELS,
-    TONE_IPA)
-from khanaa.thai_spelling import find_vowel_length
+from khanaa.thai_script import (CLUSTERS, CONSONANT_SOUND_CODA,
+    CONSONANT_SOUND_ONSET, CONSONANTS, FALSE_CLUSTERS, VOWEL_LENGTH,
+    VOWELS, TONE_IPA)
 from khanaa.utils import find_tone
 
+# IPA tone of each consonant pronounced as a separate syllable (+ อะ)
+ONSET_TONE_IPA: Dict[str, str] = {char: TONE_IPA[find_tone(char, 'อะ')]
+    for char in CONSONANTS}
+
+class OnsetPart(NamedTuple):
+    """IPA of one onset group.
+
+    cat is 'consonant' (onset of the main syllable), 'cluster' (true
+    cluster with glide) or 'sub' (separately pronounced onset).
+    """
+    cat: str
+    onset: str
+    glide: str
+    vowel: str
+    tone: str
+
+def format_onset_part(part: OnsetPart) -> str:
+    """Join non-empty IPA fields of onset part with spaces."""
+    text: str = part.onset
+    if part.glide:
+        text = f'{text} {part.glide}' if text else part.glide
+    if part.vowel:
+        text = f'{text} {part.vowel}' if text else part.vowel
+    if part.tone:
+        text = f'{text} {part.tone}' if text else part.tone
+    return text
+
 class ThaiToIPA:
     """Convert Thai spelling data to IPA."""
+    __slots__ = ('onset', 'vowel', 'silent_before', 'coda', 'silent_after',
+        'tone', 'pref', '_split_true_cluster', '_split_false_cluster',
+        '_vowel_length', 'is_true_cluster', 'is_false_cluster',
+        'onset_ipa_list', 'onset_ipa', 'vowel_ipa', 'vowel_coda_ipa',
+        'length_ipa', 'coda_ipa', 'tone_ipa')
+
     def __init__(
             self,
             onset: str,
@@ -20,6 +53,8 @@ class ThaiToIPA:
             **pref: Any) -> None:
         """Input should be already cleaned from Word and tone should
         be realized tone instead of the input tone.
+
+        Every IPA part is found once here and won't be changed after.
         """
         self.onset = onset
         self.vowel = vowel
@@ -29,46 +64,46 @@ class ThaiToIPA:
         self.tone = tone
         
         self.pref = pref
+        self._split_true_cluster: bool = pref.get('split_true_cluster', False)
+        self._split_false_cluster: bool = pref.get('split_false_cluster',
+            False)
+        self._vowel_length: str = pref.get('vowel_length', 'input')
+
+        last_two: str = onset[-2:] if len(onset) > 1 else ''
+        self.is_true_cluster: bool = (not self._split_true_cluster
+            and last_two in CLUSTERS)
+        self.is_false_cluster: bool = (not self._split_false_cluster
+            and last_two in FALSE_CLUSTERS)
+        self.onset_ipa_list: List[OnsetPart] = self._find_onset_ipa_list()
+        self.onset_ipa: str = self._find_onset_ipa()
+        self.vowel_ipa: str = VOWELS[self.vowel]['sound_vowel']
+        self.vowel_coda_ipa: str = VOWELS[self.vowel]['sound_coda']
+        self.length_ipa: str = self._find_length_ipa()
+        self.coda_ipa: str = self._find_coda_ipa()
+        self.tone_ipa: str = self._find_tone_ipa()
 
     def convert(self) -> str:
         """Return basic IPA pronunciation from data provided."""
-        joined_vowel = ''.join([self.vowel_ipa, self.length_ipa])
-        return ' '.join(filter(None, [self.onset_ipa, joined_vowel,
-            self.vowel_coda_ipa, self.coda_ipa, self.tone_ipa]))
-    
-    @property
-    def is_true_cluster(self) -> bool:
-        true_cluster = False
-        if (self.pref['split_true_cluster'] == False
-                and len(self.onset) > 1
-                and self.onset[-2:] in CLUSTERS):
-            true_cluster = True
-        return true_cluster
-    
-    @property
-    def is_false_cluster(self) -> bool:
-        false_cluster = False
-        if (self.pref['split_false_cluster'] == False
-                and len(self.onset) > 1
-                and self.onset[-2:] in FALSE_CLUSTERS):
-            false_cluster = True
-        return false_cluster
+        parts = (self.onset_ipa, self.vowel_ipa + self.length_ipa,
+            self.vowel_coda_ipa, self.coda_ipa, self.tone_ipa)
+        return ' '.join([part for part in parts if part])
     
-    @property
-    def onset_ipa_list(self) -> List[Dict[str, str]]:
-        onset_ipa_chars: List[Dict[str, str]] = []
+    def _find_onset_ipa_list(self) -> List[OnsetPart]:
+        onset_ipa_chars: List[OnsetPart] = []
         convert_onset = self.onset
         if self.is_false_cluster:
             # because false clusters have ซ sound
             convert_onset = convert_onset[:-2] + 'ซ'
+        # onsets are built forward: the last char (and the one before
+        # it in true cluster) is the main syllable onset
+        last_index: int = len(convert_onset) - 1
+        main_index: int = last_index - 1 if self.is_true_cluster else last_index
         for index, char in enumerate(convert_onset):
 
             # if it is a glide, put it with the preceding group
-            if index == len(convert_onset) - 1 and self.is_true_cluster:
-                onset_ipa_chars[-1].update({
-                    'glide': CONSONANTS[char]['sound_onset'],
-                    'cat': 'cluster'
-                })
+            if index == last_index and self.is_true_cluster:
+                onset_ipa_chars[-1] = onset_ipa_chars[-1]._replace(
+                    glide=CONSONANT_SOUND_ONSET[char], cat='cluster')
                 continue
 
             inner_cat: str = "consonant"
@@ -76,74 +111,40 @@ class ThaiToIPA:
             inner_tone: str = ""
 
             # if the onset should be separately pronounced
-            if not (index == len(convert_onset) - 1
-                    or (index == len(convert_onset) - 2 and self.is_true_cluster)):
+            if index < main_index:
                 inner_cat = "sub"
                 inner_vowel = 'a'
-                inner_tone = self.find_tone_onset(char)
-            inner_onset: str = CONSONANTS[char]['sound_onset']
-            onset_ipa_chars.append({
-                'cat': inner_cat,
-                'onset': inner_onset,
-                'glide': "",
-                'vowel': inner_vowel,
-                'tone': inner_tone
-            })
+                inner_tone = ONSET_TONE_IPA[char]
+            inner_onset: str = CONSONANT_SOUND_ONSET[char]
+            onset_ipa_chars.append(OnsetPart(inner_cat, inner_onset, "",
+                inner_vowel, inner_tone))
         return onset_ipa_chars
 
-    @property
-    def onset_ipa(self) -> str:
-        result_list: List[str] = []
-        onset_list = self.onset_ipa_list
-        for part in onset_list:
-            if part['cat'] == 'consonant':
-                result_list.append(part['onset'])
-            else:
-                subtext: str = " ".join(filter(None, [
-                    part['onset'],
-                    part['glide'],
-                    part['vowel'],
-                    part['tone']
-                ]))
-                result_list.append(subtext)
-        return ' . '.join(result_list)
+    def _find_onset_ipa(self) -> str:
+        return ' . '.join([part.onset if part.cat == 'consonant'
+            else format_onset_part(part) for part in self.onset_ipa_list])
     
     @staticmethod
-    def find_tone_onset(onset_char) -> str:
+    def find_tone_onset(onset_char: str) -> str:
         """Find IPA tone for syllabic onset character."""
-        tone_num = find_tone(onset_char, 'อะ', '', '', False)
-        return TONE_IPA[tone_num]
+        return ONSET_TONE_IPA[onset_char]
 
-    @property
-    def vowel_ipa(self) -> str:
-        return VOWELS[self.vowel]['sound_vowel']
-    
-    @property
-    def vowel_coda_ipa(self) -> str:
-        return VOWELS[self.vowel]['sound_coda']
-    
-    @property
-    def length_ipa(self) -> str:
+    def _find_length_ipa(self) -> str:
         """Return IPA symbol according to vowel length."""
         length_char = ''
-        if (find_vowel_length(self.vowel) == 'long'
-                or self.pref['vowel_length'] == 'long'):
+        if (VOWEL_LENGTH[self.vowel] == 'long'
+                or self._vowel_length == 'long'):
             length_char = 'ː'
         elif ((not self.coda and not self.vowel_coda_ipa)
-                or self.pref['vowel_length'] == 'short'):
+                or self._vowel_length == 'short'):
             length_char = 'ʔ'
         return length_char
     
-    @property
-    def coda_ipa(self) -> str:
+    def _find_coda_ipa(self) -> str:
         coda_char = ''
         if self.coda:
-            coda_char = CONSONANTS[self.coda]['sound_coda']
+            coda_char = CONSONANT_SOUND_CODA[self.coda]
         return coda_char
     
-    @property
-    def tone_ipa(self) -> str:
-        tone_char = ''
-        if self.tone in range(5):
-            tone_char = TONE_IPA[self.tone]
-        return tone_char
\ No newline at end of file
+    def _find_tone_ipa(self) -> str:
+        return TONE_IPA[self.tone] if 0 <= self.tone <= 4 else ''
@@ -1,6 +1,8 @@
+from typing import Dict, List, Optional
+
 from khanaa.pronunciation import ThaiToIPA
 
-IPA_RTGS = {
+IPA_RTGS: Dict[str, Dict[str, str]] = {
     "initial": {
         "ŋ": "ng",
         "t͡ɕ": "ch",
@@ -20,34 +22,32 @@ IPA_RTGS = {
     }
 }
 
+RTGS_INITIAL: Dict[str, str] = IPA_RTGS["initial"]
+RTGS_FINAL: Dict[str, str] = IPA_RTGS["final"]
+RTGS_VOWEL: Dict[str, str] = IPA_RTGS["vowel"]
+# aspiration becomes h, unreleased mark is dropped
+RTGS_TRANS: Dict[int, Optional[int]] = str.maketrans("ʰ", "h", u"\u031a")
+
 def ipa_to_rtgs(ipa: ThaiToIPA) -> str:
-    result = []
+    result: List[str] = []
     for part in ipa.onset_ipa_list:
         # initial
-        initial: str = part["onset"]
-        if initial in IPA_RTGS['initial']:
-            initial = IPA_RTGS['initial'][initial]
-        initial = initial.replace("ʰ", "h")
+        initial: str = RTGS_INITIAL.get(part.onset, part.onset).translate(
+            RTGS_TRANS)
         if initial == 'ʔ':
-            initial = None
-        result.append("".join(filter(None, [initial, part["glide"], part["vowel"]])))
+            initial = ''
+        result.append("".join(filter(None, [initial, part.glide, part.vowel])))
 
     vowel = ipa.vowel_ipa
-    if ipa.vowel_ipa[0] in IPA_RTGS["vowel"]:
-        vowel = IPA_RTGS["vowel"][vowel[0]] + vowel[1:]
+    if vowel[0] in RTGS_VOWEL:
+        vowel = RTGS_VOWEL[vowel[0]] + vowel[1:]
     result.append(vowel)
     
     if ipa.vowel_coda_ipa:
-        vowel_coda = ipa.vowel_coda_ipa
-        if vowel_coda in IPA_RTGS["final"]:
-            vowel_coda = IPA_RTGS["final"][vowel_coda]
-        result.append(vowel_coda)
+        result.append(RTGS_FINAL.get(ipa.vowel_coda_ipa, ipa.vowel_coda_ipa))
 
     if ipa.coda_ipa:
-        final = ipa.coda_ipa
-        if ipa.coda_ipa in IPA_RTGS["final"]:
-            final = IPA_RTGS["final"][ipa.coda_ipa]
-        final = final.replace(u"\u031a", "")
-        result.append(final)
+        final = RTGS_FINAL.get(ipa.coda_ipa, ipa.coda_ipa)
+        result.append(final.translate(RTGS_TRANS))
 
     return "".join(result)
\ No newline at end of file
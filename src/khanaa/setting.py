@@ -1,3 +1,6 @@
+from types import MappingProxyType
+from typing import Any, Mapping
+
 PREF = {
     'clear_vowel': (True, False),
     'clear_vowel_onset': ('not_true_cluster', 'all'),
@@ -21,7 +24,7 @@ PREF = {
     'low_single_h_thoo': (True, False)
 }
 
-_DEFAULT_PREF = {
+_DEFAULT_PREF: Mapping[str, Any] = MappingProxyType({
     'clear_vowel': True,
     'clear_vowel_onset': 'not_true_cluster',
     'clear_vowel_tone_mark': False,
@@ -40,4 +43,4 @@ _DEFAULT_PREF = {
     'vowel_length': 'input',
     'vowel_pair_form': {},
     'low_single_h_thoo': False
-}
\ No newline at end of file
+})
@@ -1,9 +1,25 @@
 """This module contains functions that are used for spelling word."""
 
-from typing import Any, Dict
-from khanaa.thai_script import CONSONANTS, DIACRITICS
+from functools import lru_cache, partial
+from typing import (Any, Callable, Dict, List, Mapping, NamedTuple,
+    Optional, Tuple)
+from khanaa.thai_script import CONSONANT_PAIR, DIACRITICS
+from khanaa.word import Word
 
-def combine(word: Dict[str, Any], pref: Dict[str, Any]) -> str:
+PHINTHU: str = DIACRITICS['phinthu']
+YAAMAKKAAN: str = DIACRITICS['yaamakkaan']
+KAARAN: str = DIACRITICS['kaaran']
+MAI_TAIKHUU: str = DIACRITICS['mai_taikhuu']
+
+class SpellStyle(NamedTuple):
+    """Style options in pref resolved to the methods that apply them."""
+    add_onset_diacritic: Callable[[str], str]
+    diacritic_not_h: bool
+    add_silent_before_diacritic: Callable[[str], str]
+    add_coda_diacritic: Callable[[str], str]
+    add_silent_after_diacritic: Callable[[str], str]
+
+def combine(word: Word, pref: Mapping[str, Any]) -> str:
     """Main function for combining word data and spelling word.
 
     Args:
@@ -13,21 +29,84 @@ def combine(word: Dict[str, Any], pref: Dict[str, Any]) -> str:
     Returns:
         Spelled form of the word.
     """
-    index_after_vowel: int = find_index_after_vowel(word._onset,
-        word._is_vowel_vague, word._is_low_single_vague,
-        word._is_h_vague, word._use_leading_h)
-    onset_convert: str = convert_onset(word._onset_main,
-        word._use_pair_onset, word._use_leading_h)
+    return spell_word(word, resolve_style(pref['onset_style'],
+        pref['onset_style_apply'], pref['silent_before_style'],
+        pref['coda_style'], pref['silent_after_style']))
+
+@lru_cache(maxsize=256)
+def resolve_style(onset_style: str, onset_style_apply: str,
+        silent_before_style: str, coda_style: str,
+        silent_after_style: str) -> SpellStyle:
+    """Find the methods for the style options.
+
+    Raises:
+        ValueError: If any style is not recognized.
+    """
+    add_onset_diacritic = ONSET_DIACRITIC_METHODS.get(onset_style)
+    if add_onset_diacritic is None:
+        raise ValueError('onset_style not recognized')
+    coda_methods: List[Callable[[str], str]] = []
+    for key, style in zip(CODA_STYLE_KEYS,
+            (silent_before_style, coda_style, silent_after_style)):
+        method = CODA_DIACRITIC_METHODS.get((key, style))
+        if method is None:
+            raise ValueError(f'{key} not recognized')
+        coda_methods.append(method)
+    return SpellStyle(add_onset_diacritic, onset_style_apply == 'not_h',
+        *coda_methods)
+
+def spell_word(word: Word, style: SpellStyle) -> str:
+    """Spell word with the resolved style.
+
+    Only the word data used in spelling are passed on, so the same
+    word spelled again is taken from the cache.
+    """
+    return _combine_cached(word._onset, word._is_vowel_vague,
+        word._is_low_single_vague, word._is_h_vague, word._use_leading_h,
+        word._onset_main, word._use_pair_onset, word._vowel_form,
+        word._onset_index, word._silent_before, word._coda,
+        word._silent_after, word._tone_mark, style)
+
+@lru_cache(maxsize=8192)
+def _combine_cached(onset: str, is_vowel_vague: bool,
+        is_low_single_vague: bool, is_h_vague: bool, use_leading_h: bool,
+        onset_main: str, use_pair_onset: bool, vowel_form: str,
+        onset_index: int, silent_before: str, coda: str,
+        silent_after: str, tone_mark: str, style: SpellStyle) -> str:
+    """Spell word from the data that spell_word uses."""
+    index_after_vowel: int = find_index_after_vowel(onset,
+        is_vowel_vague, is_low_single_vague, is_h_vague, use_leading_h)
+    onset_convert: str = convert_onset(onset_main, use_pair_onset,
+        use_leading_h)
+    vowel_form = fill_vowel_form(vowel_form, tone_mark)
+    combined_onset: str = join_onset(onset, onset_index, onset_convert)
     combined_onset_vowel: str = join_onset_vowel(index_after_vowel,
-        word._use_leading_h, pref['onset_style'], pref['onset_style_apply'],
-        word._vowel_form, word._onset, word._onset_index,
-        onset_convert)
-    combined_coda: str = combine_coda(word._silent_before,
-        word._coda, word._silent_after, pref)
-    combined: str = ''.join([combined_onset_vowel, combined_coda])
-    combined = delete_taikhuu(combined, word._tone_mark)
+        use_leading_h, style.add_onset_diacritic, style.diacritic_not_h,
+        vowel_form, combined_onset, onset_index)
+    combined_coda: str = combine_coda(silent_before, coda, silent_after,
+        style)
+    return delete_taikhuu(combined_onset_vowel + combined_coda, tone_mark)
+
+def combine_head(word: Word) -> str:
+    """Return the first character of the spelled form.
 
-    return combined.replace('+', word._tone_mark)
+    Same as combine(word, pref)[:1], but only the onset part that
+    decides the first character is combined. Diacritics are always
+    added after a character, so they are not needed here.
+    """
+    index_after_vowel: int = find_new_index(word._use_leading_h,
+        word._onset_index, find_index_after_vowel(word._onset,
+            word._is_vowel_vague, word._is_low_single_vague,
+            word._is_h_vague, word._use_leading_h))
+    combined_onset: str = join_onset(word._onset, word._onset_index,
+        convert_onset(word._onset_main, word._use_pair_onset,
+            word._use_leading_h))
+    before_vowel: str = combined_onset[:index_after_vowel]
+    if before_vowel:
+        return before_vowel[0]
+    if word._vowel_form[:1] != '-':
+        return word._vowel_form[:1]
+    return combined_onset[index_after_vowel:][:1]
 
 def find_index_after_vowel(onset: str, is_vowel_vague: bool,
         is_low_single_vague: bool, is_h_vague: bool,
@@ -67,48 +146,71 @@ def find_index_after_vowel(onset: str, is_vowel_vague: bool,
     
     return index_after_vowel
 
-def convert_onset(onset_main, use_pair_onset, use_leading_h):
+@lru_cache(maxsize=1024)
+def convert_onset(onset_main: str, use_pair_onset: bool,
+        use_leading_h: bool) -> str:
     """Convert onset to its pair or add ห นำ if it's needed."""
     onset_convert: str = onset_main
     if use_pair_onset:
-        onset_convert = CONSONANTS[onset_main]['pair']
+        onset_convert = CONSONANT_PAIR[onset_main]
     elif use_leading_h:
-        onset_convert = ''.join(['ห', onset_main])
+        onset_convert = 'ห' + onset_main
     return onset_convert
 
 def join_onset_vowel(index_after_vowel: int, use_leading_h: bool,
-        onset_style: str, onset_style_apply: str, vowel_form: str,
-        onset: str, onset_index: int, onset_main: str) -> str:
-    """Join onsets and vowel according to the index provided."""
-    combined_onset: str = join_onset(onset, onset_index, onset_main)
-    index_after_vowel: int = find_new_index(use_leading_h, onset_index,
+        add_onset_diacritic: Callable[[str], str], diacritic_not_h: bool,
+        vowel_form: str, combined_onset: str, onset_index: int) -> str:
+    """Join onsets and vowel according to the index provided.
+
+    combined_onset is the onsets already joined by join_onset.
+    diacritic_not_h is True if onset diacritic isn't added to ห นำ.
+    """
+    index_after_vowel = find_new_index(use_leading_h, onset_index,
         index_after_vowel)
 
-    before_vowel: str = combine_diacritic(onset_style,
+    before_vowel: str = add_onset_diacritic(
         combined_onset[:index_after_vowel])
     after_vowel: str = combined_onset[index_after_vowel:]
     if len(after_vowel) > 1:
-        diacritic_index: int = -1
-        if (use_leading_h and onset_style_apply == 'not_h'):
-            diacritic_index: int = -2
-        after_vowel = ''.join([
-            combine_diacritic(onset_style, after_vowel[:diacritic_index]),
-            after_vowel[diacritic_index:]
-        ])
+        # the last onset (and ห นำ for not_h) has no diacritic
+        plain_index: int = (-2 if use_leading_h and diacritic_not_h
+            else -1)
+        after_vowel = (add_onset_diacritic(after_vowel[:plain_index])
+            + after_vowel[plain_index:])
     
-    combined: str = ''.join([
-        before_vowel,
-        vowel_form.replace('-', after_vowel)
-    ])
+    parts: Optional[Tuple[str, str]] = split_vowel_form(vowel_form)
+    if parts is None:
+        return before_vowel + vowel_form.replace('-', after_vowel)
+    combined: str = before_vowel + parts[0] + after_vowel + parts[1]
     return combined
 
+@lru_cache(maxsize=1024)
+def fill_vowel_form(vowel_form: str, tone_mark: str) -> str:
+    """Put tone mark in vowel form (+ is the tone marker position).
+
+    Vowel forms come from a small set, so the result is cached and
+    each form is only parsed once for each tone mark.
+    """
+    return delete_taikhuu(vowel_form, tone_mark).replace('+', tone_mark)
+
+@lru_cache(maxsize=1024)
+def split_vowel_form(vowel_form: str) -> Optional[Tuple[str, str]]:
+    """Split vowel form at the consonant position (-).
+
+    Return None if the form doesn't have exactly one -.
+    """
+    if vowel_form.count('-') != 1:
+        return None
+    before, _, after = vowel_form.partition('-')
+    return before, after
+
 def join_onset(onset: str, onset_index: int, onset_convert: str) -> str:
     """Join the form of main onset with other onsets."""
     prior: str = onset[:onset_index]
     latter: str = onset[onset_index+1:]
     if onset_index == -1:
         latter = ''
-    combined_onset: str = ''.join([prior, onset_convert, latter])
+    combined_onset: str = prior + onset_convert + latter
     return combined_onset
 
 def find_new_index(use_leading_h: bool, onset_index: int, index_after_vowel: int) -> int:
@@ -117,65 +219,81 @@ def find_new_index(use_leading_h: bool, onset_index: int, index_after_vowel: int
         index_after_vowel -= 1
     return index_after_vowel
 
-def combine_diacritic(onset_style: str, content: str) -> str:
-    """Combine diacritic to the onset.
-    
-    If option specifies that we should add diacritic to onset,
-    add diacritic to every character in onset except the last one.
-    """
-    if onset_style in ['plain']:
-        return content
-    if onset_style in ['phinthu', 'yaamakkaan', 'kaaran']:
-        diacritic = DIACRITICS[f"{onset_style}"]
-        return add_diacritic(content, diacritic)
-    raise ValueError('onset_style not recognized')
-
 def add_diacritic(chars: str, diacritic: str) -> str:
     """Add diacritic to every character."""
     if chars:
-        chars = ''.join([''.join([x, diacritic]) for x in chars])
+        chars = diacritic.join(chars) + diacritic
     return chars
 
 def add_diacritic_last(chars: str, diacritic: str) -> str:
     """Add diacritic to the last character."""
     if chars:
-        chars = ''.join([chars, diacritic])
+        chars = chars + diacritic
     return chars
 
 def combine_coda(silent_before: str, coda: str, silent_after: str,
-        pref: Dict[str, Any]) -> str:
-    """Combine coda section: silent before, coda, silent after."""
-    silent_before = combine_diacritic_coda(pref,
-        silent_before, 'silent_before')
-    coda = combine_diacritic_coda(pref, coda, 'coda')
-    silent_after = combine_diacritic_coda(pref,
-        silent_after, 'silent_after')
-
-    combined_coda: str = ''.join([silent_before, coda, silent_after])
+        style: SpellStyle) -> str:
+    """Combine coda section: silent before, coda, silent after.
+
+    Every style leaves an empty section empty, so only the coda is
+    combined if there are no silent consonants (the common case).
+    """
+    add_coda_diacritic = style.add_coda_diacritic
+    if not silent_before and not silent_after:
+        return add_coda_diacritic(coda) if coda else ''
+    if (add_coda_diacritic in EVERY_CHAR_METHODS
+            and style.add_silent_before_diacritic is add_coda_diacritic
+            and style.add_silent_after_diacritic is add_coda_diacritic):
+        return add_coda_diacritic(silent_before + coda + silent_after)
+    combined_coda: str = (style.add_silent_before_diacritic(silent_before)
+        + add_coda_diacritic(coda)
+        + style.add_silent_after_diacritic(silent_after))
     return combined_coda
 
-def combine_diacritic_coda(pref: Dict[str, Any], content: str,
-        name: str) -> str:
-    """Combine coda section with diacritic, depending on option."""
-    style: str = f'{name}_style'
-    if pref[style] in ['plain']:
-        return content
-    elif pref[style] in ['hide'] and name != 'coda':
-        return ''
-    elif pref[style] in [
-            'phinthu', 'yaamakkaan', 'kaaran']:
-        diacritic = DIACRITICS[f'{pref[style]}']
-        if pref[style] in ['phinthu', 'yaamakkaan']:
-            add_method = add_diacritic
-        elif pref[style] in ['kaaran']:
-            add_method = add_diacritic_last
-        return add_method(content, diacritic)
-    else:
-        raise ValueError(f'{style} not recognized')
+def keep_content(content: str) -> str:
+    """Return content as it is (plain style)."""
+    return content
+
+def hide_content(content: str) -> str:
+    """Return empty string (hide style)."""
+    return ''
+
+# style -> method adding diacritic of that style to onset
+ONSET_DIACRITIC_METHODS: Dict[str, Callable[[str], str]] = {
+    'plain': keep_content,
+    'phinthu': partial(add_diacritic, diacritic=PHINTHU),
+    'yaamakkaan': partial(add_diacritic, diacritic=YAAMAKKAAN),
+    'kaaran': partial(add_diacritic, diacritic=KAARAN),
+}
+
+# style keys in pref of coda sections, in spelling order
+CODA_STYLE_KEYS: Tuple[str, str, str] = ('silent_before_style',
+    'coda_style', 'silent_after_style')
+
+# (style key, style) -> method adding diacritic to the coda section
+CODA_DIACRITIC_METHODS: Dict[Tuple[str, str], Callable[[str], str]] = {}
+for _key in CODA_STYLE_KEYS:
+    CODA_DIACRITIC_METHODS.update({
+        (_key, 'plain'): keep_content,
+        (_key, 'phinthu'): ONSET_DIACRITIC_METHODS['phinthu'],
+        (_key, 'yaamakkaan'): ONSET_DIACRITIC_METHODS['yaamakkaan'],
+        (_key, 'kaaran'): partial(add_diacritic_last, diacritic=KAARAN),
+    })
+    if _key != 'coda_style':
+        CODA_DIACRITIC_METHODS[_key, 'hide'] = hide_content
+del _key
+
+# methods adding diacritic to every character, so the whole coda
+# section can be added at once if all parts use the same one
+EVERY_CHAR_METHODS = frozenset([ONSET_DIACRITIC_METHODS['phinthu'],
+    ONSET_DIACRITIC_METHODS['yaamakkaan']])
 
 def delete_taikhuu(combined: str, tone_mark: str) -> str:
-    """Delete mai taikhuu if there's also a tone marker."""
-    mai_taikhuu: str = DIACRITICS['mai_taikhuu']
-    if tone_mark and combined.find(mai_taikhuu) != -1:
-        combined = combined.replace(mai_taikhuu, '')
+    """Delete mai taikhuu if there's also a tone marker.
+
+    Vowel forms are cleaned before the tone mark is filled in, and the
+    combined word again, since silent consonants are given as they are.
+    """
+    if tone_mark and MAI_TAIKHUU in combined:
+        combined = combined.replace(MAI_TAIKHUU, '')
     return combined
\ No newline at end of file
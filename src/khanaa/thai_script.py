@@ -54,9 +54,33 @@ Vowel form not in this:
 ออ (with ร as coda) appearing as -+ (กร ศร)
 อ็ (ก็)
 เออ (with coda) appearing as เ-+อ (เทอม เทอญ)
+
+The top level of each dict table is a MappingProxyType, so keys
+can't be added or replaced. The dicts inside CONSONANTS and VOWELS
+are still plain dicts and must not be changed: the flat CONSONANT_*
+and VOWEL_* tables are snapshots of them taken at import. All strings
+in the tables are interned by _intern when the tables are built, so
+that lookups with the same characters share one string object.
 """
 
-CONSONANTS = {
+import sys
+from types import MappingProxyType
+from typing import Final, TypeVar, cast
+
+T = TypeVar('T')
+
+def _intern(value: T) -> T:
+    """Intern strings in table (dict, set, list, tuple) recursively."""
+    if isinstance(value, str):
+        return cast(T, sys.intern(value))
+    if isinstance(value, dict):
+        return cast(T, {_intern(key): _intern(item)
+            for key, item in value.items()})
+    if isinstance(value, (set, frozenset, list, tuple)):
+        return type(value)(_intern(item) for item in value)
+    return value
+
+CONSONANTS: Final = MappingProxyType(_intern({
     'ก': {
         'class': 'mid',
         'pair': '',
@@ -379,9 +403,9 @@ CONSONANTS = {
         'sound_onset': 'h',
         'sound_coda': 'h'
     }
-}
+}))
 
-CLUSTERS = {
+CLUSTERS: Final = _intern(frozenset({
     'กร', 'กล', 'กว',
     'ขร', 'คร', 'ขล', 'คล', 'ขว', 'คว',
     'บร', 'บล',
@@ -391,13 +415,13 @@ CLUSTERS = {
     'ตร',
     'ทร',
     'ดร'
-}
+}))
 
-FALSE_CLUSTERS = {
+FALSE_CLUSTERS: Final = _intern(frozenset({
     'จร', 'ซร', 'ศร', 'สร'
-}
+}))
 
-VOWELS = {
+VOWELS: Final = MappingProxyType(_intern({
     # MONOPHTHONGS
     'อะ': {
         'form_no_coda': '-+ะ',
@@ -965,93 +989,119 @@ VOWELS = {
         'sound_vowel': 'a',
         'sound_coda': 'm' # or ŋ
     }
-}
+}))
 
-VOWEL_CHAR = 'ะัาำิีึืุูเแโใไๅ็ั'
+VOWEL_CHAR: Final = _intern('ะัาำิีึืุูเแโใไๅ็ั')
 
-TONES = {
+TONES: Final = MappingProxyType(_intern({
     0: {
-        'mid alive': ['', ''],
-        'mid dead': ['', ''], # cannot
-        'high alive': ['pair', ''],
-        'high short dead': ['', ''], # cannot
-        'high long dead': ['', ''], # cannot
-        'low alive': ['', ''],
-        'low short dead': ['', ''], # cannot
-        'low long dead': ['', ''] # cannot
+        'mid alive': ('', ''),
+        'mid dead': ('', ''), # cannot
+        'high alive': ('pair', ''),
+        'high short dead': ('', ''), # cannot
+        'high long dead': ('', ''), # cannot
+        'low alive': ('', ''),
+        'low short dead': ('', ''), # cannot
+        'low long dead': ('', '') # cannot
     },
     1: {
-        'mid alive': ['', 'mai_eek'],
-        'mid dead': ['', ''],
-        'high alive': ['', 'mai_eek'],
-        'high short dead': ['', ''],
-        'high long dead': ['', ''],
-        'low alive': ['pair', 'mai_eek'],
-        'low short dead': ['pair', ''],
-        'low long dead': ['pair', '']
+        'mid alive': ('', 'mai_eek'),
+        'mid dead': ('', ''),
+        'high alive': ('', 'mai_eek'),
+        'high short dead': ('', ''),
+        'high long dead': ('', ''),
+        'low alive': ('pair', 'mai_eek'),
+        'low short dead': ('pair', ''),
+        'low long dead': ('pair', '')
     },
     2: {
-        'mid alive': ['', 'mai_thoo'],
-        'mid dead': ['', 'mai_thoo'],
-        'high alive': ['', 'mai_thoo'],
-        'high short dead': ['', 'mai_thoo'],
-        'high long dead': ['', 'mai_thoo'],
-        'low alive': ['', 'mai_eek'],
-        'low short dead': ['', 'mai_eek'],
-        'low long dead': ['', '']
+        'mid alive': ('', 'mai_thoo'),
+        'mid dead': ('', 'mai_thoo'),
+        'high alive': ('', 'mai_thoo'),
+        'high short dead': ('', 'mai_thoo'),
+        'high long dead': ('', 'mai_thoo'),
+        'low alive': ('', 'mai_eek'),
+        'low short dead': ('', 'mai_eek'),
+        'low long dead': ('', '')
     },
     3: {
-        'mid alive': ['', 'mai_trii'],
-        'mid dead': ['', 'mai_trii'],
-        'high alive': ['pair', 'mai_thoo'],
-        'high short dead': ['pair', ''],
-        'high long dead': ['pair', 'mai_thoo'],
-        'low alive': ['', 'mai_thoo'],
-        'low short dead': ['', ''],
-        'low long dead': ['', 'mai_thoo']
+        'mid alive': ('', 'mai_trii'),
+        'mid dead': ('', 'mai_trii'),
+        'high alive': ('pair', 'mai_thoo'),
+        'high short dead': ('pair', ''),
+        'high long dead': ('pair', 'mai_thoo'),
+        'low alive': ('', 'mai_thoo'),
+        'low short dead': ('', ''),
+        'low long dead': ('', 'mai_thoo')
     },
     4: {
-        'mid alive': ['', 'mai_jattawaa'],
-        'mid dead': ['', 'mai_jattawaa'], # can but no usage
-        'high alive': ['', ''],
-        'high short dead': ['pair', 'mai_jattawaa'], # can but no usage
-        'high long dead': ['pair', 'mai_jattawaa'], # can but no usage
-        'low alive': ['pair', ''],
-        'low short dead': ['', 'mai_jattawaa'], # can but no usage
-        'low long dead': ['', 'mai_jattawaa'] # can but no usage
+        'mid alive': ('', 'mai_jattawaa'),
+        'mid dead': ('', 'mai_jattawaa'), # can but no usage
+        'high alive': ('', ''),
+        'high short dead': ('pair', 'mai_jattawaa'), # can but no usage
+        'high long dead': ('pair', 'mai_jattawaa'), # can but no usage
+        'low alive': ('pair', ''),
+        'low short dead': ('', 'mai_jattawaa'), # can but no usage
+        'low long dead': ('', 'mai_jattawaa') # can but no usage
     }
-}
+}))
 
-LOW_SINGLE_ALT = ['pair', 'mai_thoo'] # for falling tone เสียงโท
+# for falling tone เสียงโท
+LOW_SINGLE_ALT: Final = _intern(('pair', 'mai_thoo'))
 
-TONE_NOT_AVAILABLE = {
+TONE_NOT_AVAILABLE: Final = MappingProxyType(_intern({
     0: {
-        'mid dead': ['', ''], # cannot
-        'high short dead': ['', ''], # cannot
-        'high long dead': ['', ''], # cannot
-        'low short dead': ['', ''], # cannot
-        'low long dead': ['', ''] # cannot
+        'mid dead': ('', ''), # cannot
+        'high short dead': ('', ''), # cannot
+        'high long dead': ('', ''), # cannot
+        'low short dead': ('', ''), # cannot
+        'low long dead': ('', '') # cannot
     }
-}
+}))
 
-TONE_MARKERS = {
+TONE_MARKERS: Final = MappingProxyType(_intern({
     'mai_eek': u'\u0e48',
     'mai_thoo': u'\u0e49',
     'mai_trii': u'\u0e4a',
     'mai_jattawaa': u'\u0e4b'
-}
+}))
 
-DIACRITICS = {
+DIACRITICS: Final = MappingProxyType(_intern({
     'mai_taikhuu': u'\u0e47',
     'kaaran': u'\u0e4c',
     'phinthu': u'\u0e3a',
     'yaamakkaan': u'\u0e4e'
-}
+}))
 
-TONE_IPA = {
+TONE_IPA: Final = MappingProxyType(_intern({
     0: '˧',
     1: '˨˩',
     2: '˥˩',
     3: '˦˥',
     4: '˩˩˦',
-}
\ No newline at end of file
+}))
+
+# Each consonant property in its own table, so a lookup is one dict
+# access instead of two (CONSONANTS[char]['class'])
+CONSONANT_CLASS: Final = MappingProxyType({char: info['class']
+    for char, info in CONSONANTS.items()})
+CONSONANT_PAIR: Final = MappingProxyType({char: info['pair']
+    for char, info in CONSONANTS.items()})
+CONSONANT_CODA_CLASS: Final = MappingProxyType({char: info['coda_class']
+    for char, info in CONSONANTS.items()})
+CONSONANT_SOUND_ONSET: Final = MappingProxyType({char: info['sound_onset']
+    for char, info in CONSONANTS.items()})
+CONSONANT_SOUND_CODA: Final = MappingProxyType({char: info['sound_coda']
+    for char, info in CONSONANTS.items()})
+
+# Same for vowel properties
+VOWEL_FORM_NO_CODA: Final = MappingProxyType({vowel: info['form_no_coda']
+    for vowel, info in VOWELS.items()})
+VOWEL_FORM_WITH_CODA: Final = MappingProxyType({
+    vowel: info['form_with_coda'] for vowel, info in VOWELS.items()})
+VOWEL_LENGTH: Final = MappingProxyType({vowel: info['length']
+    for vowel, info in VOWELS.items()})
+VOWEL_PAIR: Final = MappingProxyType({vowel: info['pair']
+    for vowel, info in VOWELS.items()})
+VOWEL_SOUND_CODA: Final = MappingProxyType({vowel: info['sound_coda']
+    for vowel, info in VOWELS.items()})
@@ -1,11 +1,23 @@
 """Thai spelling"""
 
-from typing import Any, List, Dict
-
-from .thai_script import (CLUSTERS, CONSONANTS, VOWELS, TONES,
-    TONE_MARKERS, DIACRITICS)
-
-_DEFAULT_PREF = {
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (Any, List, Dict, Final, Mapping, NamedTuple, Optional,
+    Tuple)
+
+from .thai_script import (CLUSTERS, CONSONANTS, CONSONANT_CLASS,
+    CONSONANT_PAIR, VOWELS, VOWEL_FORM_NO_CODA, VOWEL_FORM_WITH_CODA,
+    VOWEL_LENGTH, VOWEL_PAIR, VOWEL_SOUND_CODA, TONES, TONE_MARKERS,
+    DIACRITICS)
+from .utils import (FrozenPref, _freeze_pref, _thaw_pref, check_checked,
+    find_letter_list, find_tone_phrase, find_vowel_length, find_vowel_pair)
+
+# names exported by `from khanaa.thai_spelling import *`
+__all__ = ['SpellWord', 'CLUSTERS', 'CONSONANTS', 'DIACRITICS', 'TONES',
+    'TONE_MARKERS', 'VOWELS', 'find_letter_list', 'find_vowel_length',
+    'find_vowel_pair']
+
+_DEFAULT_PREF: Mapping[str, Any] = MappingProxyType({
     'clear_vowel': True,
     'clear_vowel_onset': 'not_true_cluster',
     'clear_vowel_tone_mark': False,
@@ -20,13 +32,47 @@ _DEFAULT_PREF = {
     'vowel_coda_form': {},
     'vowel_length': 'input',
     'vowel_pair_form': {}
-}
+})
+
+_VOWEL_LENGTHS: Final = frozenset({'short', 'long'})
+_DIACRITIC_STYLES: Final = frozenset({'phinthu', 'yaamakkaan', 'kaaran'})
+_PAIR_CLASSES: Final = frozenset({'high', 'low_pair'})
+_CODA_SECTIONS: Final = ('silent_before', 'coda', 'silent_after')
+
+# Styles resolved from option strings, see _resolve_style
+_STYLE_NOT_RECOGNIZED: Final = -1
+_STYLE_PLAIN: Final = 0
+_STYLE_EVERY_CHAR: Final = 1
+_STYLE_LAST_CHAR: Final = 2
+_STYLE_HIDE: Final = 3
+
+class _SpellData(NamedTuple):
+    """Word data found before applying the tone."""
+    onset_used: str
+    onset_used_index: int
+    vowel_used: str
+    vowel_form: str
+    coda: str
+    silent_after: str
+    low_single_is_ambiguous: bool
+    h_is_ambiguous: bool
 
 class SpellWord:
+    __slots__ = ('option', '_option_seen', '_option_key', '_onset_style',
+        '_coda_styles',
+        '_onset_plain', '_coda_plain', '_clear_vowel', '_clear_vowel_all',
+        '_clear_vowel_not_true_cluster',
+        '_clear_vowel_tone_mark', '_obvious_low_singles',
+        '_obvious_h_low_single', '_diacritic_not_h', '_vowel_coda_form',
+        '_vowel_length', '_vowel_pair_form', '_vowel_no_coda_pair',
+        '_vowel_coda_resolved')
+
     def __init__(self, **pref: Any) -> None:
         """Init SpellWord with setting.
 
         None of the keyword arguments here are required.
+        The setting is kept in self.option, a change to it is used
+        from the next spell_out or all_tone call.
 
         Find all available Thai consonants, vowels, and true clusters
         from find_letter_list()
@@ -104,7 +150,52 @@ class SpellWord:
                 vowel_pair_form={'อาย': 'อัย'}
                 (อาย will be shorten to อัย instead of the default ไอ)
         """
-        self.option = {**_DEFAULT_PREF, **pref}
+        self.option: Dict[str, Any] = _copy_option({**_DEFAULT_PREF, **pref})
+        self._resolve_option()
+
+    def _resolve_option(self) -> None:
+        """Resolve self.option into the values read in every spell_out.
+
+        A copy of the option is kept, so that a change to self.option
+        after init is found (see _check_option) and resolved again.
+        """
+        self._option_seen: Dict[str, Any] = _copy_option(self.option)
+        self._option_key: Optional[FrozenPref] = (
+            _DEFAULT_OPTION_KEY if self._option_seen == _DEFAULT_PREF
+            else _freeze_pref(self._option_seen))
+        option = self._option_seen
+        self._onset_style = _resolve_style(
+            'onset', option['onset_style'])
+        self._coda_styles = {name: _resolve_style(
+            name, option[f'{name}_style']) for name in _CODA_SECTIONS}
+        self._onset_plain = self._onset_style[0] == _STYLE_PLAIN
+        self._coda_plain = all(style_id == _STYLE_PLAIN
+            for style_id, _ in self._coda_styles.values())
+
+        # Options read in every spell_out
+        self._clear_vowel: bool = option['clear_vowel']
+        self._clear_vowel_all: bool = option['clear_vowel_onset'] == 'all'
+        self._clear_vowel_not_true_cluster: bool = (
+            option['clear_vowel_onset'] == 'not_true_cluster')
+        self._clear_vowel_tone_mark: bool = option['clear_vowel_tone_mark']
+        self._obvious_low_singles: bool = (
+            option['obvious_low_singles'] == True)
+        self._obvious_h_low_single: bool = (
+            option['obvious_h_low_single'] == True)
+        self._diacritic_not_h: bool = option['onset_style_apply'] == 'not_h'
+        self._vowel_coda_form: Dict[str, str] = option['vowel_coda_form']
+        # '' if vowel length follows the input
+        self._vowel_length: str = (option['vowel_length']
+            if option['vowel_length'] in _VOWEL_LENGTHS else '')
+        self._vowel_pair_form: Dict[str, str] = option['vowel_pair_form']
+        self._vowel_no_coda_pair: bool = option['vowel_no_coda'] == 'pair'
+        self._vowel_coda_resolved = (_VOWEL_CODA_PAIR
+            if self._vowel_no_coda_pair else _VOWEL_CODA_SILENT)
+
+    def _check_option(self) -> None:
+        """Resolve the option again if self.option has been changed."""
+        if self.option != self._option_seen:
+            self._resolve_option()
 
     def spell_out(
             self,
@@ -147,65 +238,113 @@ class SpellWord:
                 0 mid สามัญ, 1 low เอก, 2 falling โท, 3 high ตรี,
                 4 rising จัตวา. Defaults to -1.
         """
-        self.onset = {'used': onset, 'input': onset, 'used_index': -1}
-        self.vowel = {'used': vowel}
-        self.silent_before = silent_before
-        self.coda = coda
-        self.silent_after = silent_after
-        self.tone = tone
-
-        self._find_data()
-        self._delete_taikhuu()
-        combined = self._combine()
-        combined = combined.replace('+', self.tone_mark)
-        combined_coda = self._combine_coda()
-
-        result = ''.join([combined, combined_coda])
+        self._check_option()
+        if self._option_key is None:
+            return self._spell_out(onset, vowel, silent_before, coda,
+                silent_after, tone)
+        return _spell_core(self._option_key, onset, vowel, silent_before,
+            coda, silent_after, tone)
+
+    def _spell_out(
+            self,
+            onset: str,
+            vowel: str,
+            silent_before: str,
+            coda: str,
+            silent_after: str,
+            tone: int) -> str:
+        """Spell out the word without the cache. See spell_out."""
+        data = self._find_data(onset, vowel, coda, silent_after)
+        return self._spell_tone(onset, silent_before, data, tone)
+
+    def _all_tone(
+            self,
+            onset: str,
+            vowel: str,
+            silent_before: str = '',
+            coda: str = '',
+            silent_after: str = '') -> Tuple[str, ...]:
+        """Spell out all five tones without the cache. See all_tone.
+
+        Data that doesn't depend on the tone is found only once.
+        """
+        data = self._find_data(onset, vowel, coda, silent_after)
+        return tuple(self._spell_tone(onset, silent_before, data, tone_num)
+            for tone_num in range(0, 5))
+
+    def _spell_tone(
+            self,
+            onset: str,
+            silent_before: str,
+            data: _SpellData,
+            tone: int) -> str:
+        """Spell out the word from the data found in _find_data."""
+        onset_form, tone_mark = self._find_tone(
+            data.onset_used, data.vowel_used, data.coda, tone)
+        parts = self._combine(onset, data, onset_form, data.vowel_form,
+            tone_mark)
+        parts.extend(self._combine_coda(
+            silent_before, data.coda, data.silent_after))
+
+        result = ''.join(parts)
         return result
 
-    def _find_data(self) -> None:
+    def _find_data(
+            self,
+            onset: str,
+            vowel: str,
+            coda: str,
+            silent_after: str) -> _SpellData:
         """Check and collect data for the word"""
-        self._check_vowel_coda()
-        self._check_multiple_coda()
-        self._select_onset()
-        self._check_low_singles()
-        self._check_h_low_single()
-        self._find_vowel()
-        self._find_tone()
-
-    def _check_vowel_coda(self) -> None:
+        coda, silent_after = self._check_vowel_coda(vowel, coda, silent_after)
+        coda, silent_after = self._check_multiple_coda(coda, silent_after)
+        onset_used, used_index = self._select_onset(onset)
+        onset_used, used_index, low_single_is_ambiguous, h_is_ambiguous = (
+            self._check_ambiguity(onset, onset_used, used_index))
+        vowel_used, vowel_form, coda, silent_after = self._find_vowel(
+            vowel, coda, silent_after)
+        return _SpellData(onset_used, used_index, vowel_used, vowel_form,
+            coda, silent_after, low_single_is_ambiguous, h_is_ambiguous)
+
+    @staticmethod
+    def _check_vowel_coda(
+            vowel: str, coda: str, silent_after: str) -> Tuple[str, str]:
         """If the vowel already coda, change coda to silent after.
-        
+
         Ex. อัย เอา already have j, w coda. They can't have coda.
         """
-        if VOWELS[self.vowel['used']]['sound_coda']:
-            self._coda_to_silent()
+        if VOWEL_SOUND_CODA[vowel]:
+            return SpellWord._coda_to_silent(coda, silent_after)
+        return coda, silent_after
 
-    def _coda_to_silent(self) -> None:
+    @staticmethod
+    def _coda_to_silent(coda: str, silent_after: str) -> Tuple[str, str]:
         """Change coda to silent after."""
         new_silent_after = ''.join([
-            self.coda,
-            self.silent_after
+            coda,
+            silent_after
         ])
-        self.silent_after = new_silent_after
-        self.coda = ''
+        return '', new_silent_after
 
-    def _check_multiple_coda(self) -> None:
+    @staticmethod
+    def _check_multiple_coda(
+            coda: str, silent_after: str) -> Tuple[str, str]:
         """Change all but the first coda to silent after.
-        
+
         If coda has more than one consonants,
         insert every consonant after the first one to silent after."""
-        if len(self.coda) > 1:
+        if len(coda) > 1:
             new_silent_after = ''.join([
-                self.coda[1:],
-                self.silent_after
+                coda[1:],
+                silent_after
             ])
-            self.silent_after = new_silent_after
-            self.coda = self.coda[0]
+            return coda[0], new_silent_after
+        return coda, silent_after
 
-    def _select_onset(self) -> None:
+    @staticmethod
+    def _select_onset(onset: str) -> Tuple[str, int]:
         """Select the main onset to determine tone from it.
-        
+
         According to general rule of Thai onset cluster:
 
         - If the latter consonant is in single low class,
@@ -216,186 +355,172 @@ class SpellWord:
 
         All of single low consonants are sonorants.
 
-        "used" is the consonant used to derive the tone of the word.
+        Return the consonant used to derive the tone of the word
+        and its index.
         """
-        if len(self.onset['used']) > 1:
-            if CONSONANTS[self.onset['used'][-1]]['class'] == 'low_single':
+        if len(onset) > 1:
+            if CONSONANT_CLASS[onset[-1]] == 'low_single':
                 used_index = -2
             else:
                 used_index = -1
-            onset_used = self.onset['used'][used_index]
-            self.onset.update({
-                'used': onset_used,
-                'used_index': used_index
-            })
-
-    def _check_low_singles(self) -> None:
-        """Check for low single-low single onset cluster ambiguity.
-        
-        If true, we'll use the latter consonant as the main consonant
-        to determine tone.
-        Ex. นวี นหวี่ นวี่ นวี้ นหวี
-        instead of นวี หนวี่ นวี่ นวี้ หนวี
-        """
-        if (self.option['obvious_low_singles'] == True
-                and len(self.onset['input']) > 1
-                and CONSONANTS[self.onset['input'][-1]]['class'] == 'low_single'
-                and CONSONANTS[self.onset['input'][-2]]['class'] == 'low_single'
-            ):
-            self.onset.update({
-                'used_index': -1,
-                'used': self.onset['input'][-1],
-            })
-            self.low_single_is_ambiguous = True
-        else:
-            self.low_single_is_ambiguous = False
+            return onset[used_index], used_index
+        return onset, -1
 
-    def _check_h_low_single(self) -> None:
-        """Check for ฮ and single low onset cluster ambiguity.
-        
-        If true, we'll use the latter consonant as the main consonant
-        to determine tone. (ฮ is paired low and will have the same tone marker
+    def _check_ambiguity(
+            self,
+            onset: str,
+            onset_used: str,
+            used_index: int) -> Tuple[str, int, bool, bool]:
+        """Check for ambiguity of onset cluster ending in single low.
+
+        If the cluster is low single-low single (ex. นวี นหวี่ นวี่ นวี้ นหวี
+        instead of นวี หนวี่ นวี่ นวี้ หนวี) or ฮ and single low (ex. ฮวา
+        ฮหว่า ฮว่า ฮว้า ฮหวา instead of ฮวา หว่า ฮว่า ฮว้า หวา), we'll use
+        the latter consonant as the main consonant to determine tone.
+        (ฮ is paired low and will have the same tone marker
         with single low vowel).
-        Ex. ฮวา ฮหว่า ฮว่า ฮว้า ฮหวา
-        instead of ฮวา หว่า ฮว่า ฮว้า หวา
+
+        Return onset used, its index, whether low single-low single is
+        ambiguous and whether ฮ and single low is ambiguous.
         """
-        if (self.option['obvious_h_low_single'] == True
-                and len(self.onset['input']) > 1
-                and self.onset['input'][-2] == 'ฮ'
-                and CONSONANTS[self.onset['input'][-1]]['class'] == 'low_single'):
-            self.onset.update({
-                'used_index': -1,
-                'used': self.onset['input'][-1],
-            })
-            self.h_is_ambiguous = True
-        else:
-            self.h_is_ambiguous = False
-
-    def _find_vowel(self) -> None:
-        """Find vowel to use from VOWELS"""
-        vowel_used = self.vowel['used']
-        vowel_used = self._select_vowel_length(vowel_used)
-        if not self.coda:
-            vowel_form = VOWELS[vowel_used]['form_no_coda']
+        if len(onset) < 2 or CONSONANT_CLASS[onset[-1]] != 'low_single':
+            return onset_used, used_index, False, False
+        prior = onset[-2]
+        if (self._obvious_low_singles
+                and CONSONANT_CLASS[prior] == 'low_single'):
+            return onset[-1], -1, True, False
+        if self._obvious_h_low_single and prior == 'ฮ':
+            return onset[-1], -1, False, True
+        return onset_used, used_index, False, False
+
+    def _find_vowel(
+            self,
+            vowel: str,
+            coda: str,
+            silent_after: str) -> Tuple[str, str, str, str]:
+        """Find vowel to use from VOWELS.
+
+        Return vowel used, vowel form, coda and silent after.
+        """
+        vowel_used = self._select_vowel_length(vowel)
+        if not coda:
+            vowel_form = VOWEL_FORM_NO_CODA[vowel_used]
         else:
-            if (self.option['vowel_coda_form']
-                and vowel_used in self.option['vowel_coda_form']):
-                vowel_form = self.option['vowel_coda_form'][vowel_used]
+            vowel_coda_form = self._vowel_coda_form
+            if vowel_coda_form and vowel_used in vowel_coda_form:
+                vowel_form = vowel_coda_form[vowel_used]
+            elif vowel_used in self._vowel_coda_resolved:
+                vowel_used, vowel_form, coda_to_silent = (
+                    self._vowel_coda_resolved[vowel_used])
+                if coda_to_silent:
+                    coda, silent_after = self._coda_to_silent(
+                        coda, silent_after)
+                return vowel_used, vowel_form, coda, silent_after
             else:
-                vowel_form = VOWELS[vowel_used]['form_with_coda']
-        self.vowel.update({
-            'used': vowel_used,
-            'form': vowel_form
-        })
-        if not self.vowel['form']:
-            self._deal_empty_vowel()
+                vowel_form = VOWEL_FORM_WITH_CODA[vowel_used]
+        if not vowel_form:
+            return self._deal_empty_vowel(vowel_used, coda, silent_after)
+        return vowel_used, vowel_form, coda, silent_after
 
     def _select_vowel_length(self, vowel_used: str) -> str:
         """Select vowel length according to the preference."""
-        if self.option['vowel_length'] not in ['short', 'long']:
+        vowel_length = self._vowel_length
+        if not vowel_length:
             return vowel_used
         current_length = find_vowel_length(vowel_used)
-        if self.option['vowel_length'] != current_length:
-            if (self.option['vowel_pair_form']
-                    and vowel_used in self.option['vowel_pair_form']):
-                vowel_used = self.option['vowel_pair_form'][vowel_used]
+        if vowel_length != current_length:
+            vowel_pair_form = self._vowel_pair_form
+            if vowel_pair_form and vowel_used in vowel_pair_form:
+                vowel_used = vowel_pair_form[vowel_used]
             else:
                 vowel_used = find_vowel_pair(vowel_used)
         return vowel_used
 
-    def _deal_empty_vowel(self) -> None:
+    def _deal_empty_vowel(
+            self,
+            vowel_used: str,
+            coda: str,
+            silent_after: str) -> Tuple[str, str, str, str]:
         """Find vowel to use if vowel from VOWEL is empty.
-        
+
         Some vowels don't have coda form, so there are two choices:
         - Use coda form from its pair
         - Change coda to silent letter
         The choice is up to the setting.
         """
-        if self.option['vowel_no_coda'] == 'pair':
-            vowel_used = VOWELS[self.vowel['used']]['pair']
-            vowel_form = VOWELS[vowel_used]['form_with_coda']
+        if self._vowel_no_coda_pair:
+            vowel_used = VOWEL_PAIR[vowel_used]
+            vowel_form = VOWEL_FORM_WITH_CODA[vowel_used]
         else:
-            vowel_used = self.vowel['used']
-            vowel_form = VOWELS[vowel_used]['form_no_coda']
-            self._coda_to_silent()
-        self.vowel.update({
-            'used': vowel_used,
-            'form': vowel_form
-        })
-
-    def _find_tone(self) -> None:
+            vowel_form = VOWEL_FORM_NO_CODA[vowel_used]
+            coda, silent_after = self._coda_to_silent(coda, silent_after)
+        return vowel_used, vowel_form, coda, silent_after
+
+    @staticmethod
+    def _find_tone(
+            onset_used: str,
+            vowel_used: str,
+            coda: str,
+            tone: int) -> Tuple[str, str]:
         """Find consonant form and tone marker according to tone."""
+        onset_form = onset_used
+        tone_mark = ''
 
-        self.onset.update({'form': self.onset['used']})
-        self.tone_mark = ''
+        if tone not in TONES:
+            return onset_form, tone_mark
 
-        if self.tone not in range(5):
-            return
-        
-        tone_info = self._find_tone_info()
-
-        if tone_info[0] == 'pair':
-            if CONSONANTS[self.onset['used']]['class'] == 'high':
-                self._use_pair_onset()
-            elif CONSONANTS[self.onset['used']]['class'] == 'low_pair':
-                self._use_pair_onset()
-            if CONSONANTS[self.onset['used']]['class'] == 'low_single':
-                self._use_h_onset()
-
-        if tone_info[1]:
-            self.tone_mark = TONE_MARKERS[tone_info[1]]
-
-    def _find_tone_info(self) -> List[str]:
-        """Find tone information from TONES"""
-        onset_class = CONSONANTS[self.onset['used']]['class']
-        if onset_class in ['low_pair', 'low_single']:
-            onset_class = 'low'
-        alive_dead = 'dead' if self._is_checked() else 'alive'
-        length = VOWELS[self.vowel['used']]['length']
-
-        if onset_class in ['high', 'low'] and alive_dead == 'dead':
-            word_detail = f'{onset_class} {length} {alive_dead}'
-        else:
-            word_detail = f'{onset_class} {alive_dead}'
-            
-        tone_info = TONES[self.tone][word_detail]
-        return tone_info
+        use_pair, tone_mark = SpellWord._find_tone_info(
+            onset_used, vowel_used, coda, tone)
 
-    def _is_checked(self) -> bool:
-        """Check if the word is checked (dead) or not.
-        
-        Checked word in Thai:
-        - Has no coda, short length (and no hidden coda like ไอ)
-        - Has dead class coda"""
-        checked = False
-        if (not self.coda
-                and VOWELS[self.vowel['used']]['length'] == 'short'
-                and not VOWELS[self.vowel['used']]['sound_coda']
-            ):
-            checked = True
-        elif (self.coda
-                and CONSONANTS[self.coda]['coda_class'] == 'dead'
-            ):
-            checked = True
-        return checked
-
-    def _use_pair_onset(self) -> None:
+        if use_pair:
+            onset_class = CONSONANT_CLASS[onset_used]
+            if onset_class in _PAIR_CLASSES:
+                onset_form = SpellWord._use_pair_onset(onset_used)
+            elif onset_class == 'low_single':
+                onset_form = SpellWord._use_h_onset(onset_used)
+        return onset_form, tone_mark
+
+    @staticmethod
+    def _find_tone_info(
+            onset_used: str,
+            vowel_used: str,
+            coda: str,
+            tone: int) -> Tuple[bool, str]:
+        """Find if pair onset is used and the tone marker from TONE_INFO"""
+        return TONE_INFO[(
+            tone,
+            CONSONANT_CLASS[onset_used],
+            check_checked(vowel_used, coda),
+            VOWEL_LENGTH[vowel_used]
+        )]
+
+    @staticmethod
+    def _use_pair_onset(onset_used: str) -> str:
         """Change onset to its class pair ex. ข => ค or ค => ข"""
-        self.onset.update({'form': CONSONANTS[self.onset['used']]['pair']})
-    
-    def _use_h_onset(self) -> None:
+        return CONSONANT_PAIR[onset_used]
+
+    @staticmethod
+    def _use_h_onset(onset_used: str) -> str:
         """Add ห to the onset."""
-        self.onset.update({'form': ''.join(['ห', self.onset['used']])})
+        return ''.join(['ห', onset_used])
 
-    def _delete_taikhuu(self) -> None:
+    @staticmethod
+    def _delete_taikhuu(vowel_form: str, tone_mark: str) -> str:
         """Delete mai taikhuu if there's also a tone marker."""
         mai_taikhuu = DIACRITICS['mai_taikhuu']
-        if self.tone_mark and self.vowel['form'].find(mai_taikhuu) != -1:
-            self.vowel['form'] = self.vowel['form'].replace(mai_taikhuu, '')
+        if tone_mark and vowel_form.find(mai_taikhuu) != -1:
+            vowel_form = vowel_form.replace(mai_taikhuu, '')
+        return vowel_form
+
+    def _combine(
+            self,
+            onset: str,
+            data: _SpellData,
+            onset_form: str,
+            vowel_form: str,
+            tone_mark: str) -> List[str]:
+        """Return parts of joined onset, vowel and tone marker.
 
-    def _combine(self) -> str:
-        """Return joined onset and vowel.
-        
         index_after_vowel is the index of consonant that
         should be after the vowel. Note that ห นำ is still not
         being calculated in this index yet.
@@ -417,98 +542,126 @@ class SpellWord:
         Same case with ambiguous ฮ and single low cluster.
 
         Otherwise use general case: Every onset is after the vowel."""
-        if len(self.onset['input']) > 2:
+        if len(onset) > 2:
             index_after_vowel = -2
-        elif self._is_vowel_ambiguous():
+        elif self._is_vowel_ambiguous(onset, tone_mark):
             index_after_vowel = -1
-        elif self.low_single_is_ambiguous and len(self.onset['form']) == 2:
+        elif data.low_single_is_ambiguous and len(onset_form) == 2:
             index_after_vowel = -1
-        elif self.h_is_ambiguous and len(self.onset['form']) == 2:
+        elif data.h_is_ambiguous and len(onset_form) == 2:
             index_after_vowel = -1
         else:
             index_after_vowel = 0
-        combined = self._join_onset_vowel(index_after_vowel)
-        
+        combined = self._join_onset_vowel(index_after_vowel, onset,
+            data.onset_used_index, onset_form, vowel_form, tone_mark)
+
         return combined
-    
-    def _is_vowel_ambiguous(self) -> bool:
+
+    def _is_vowel_ambiguous(self, onset: str, tone_mark: str) -> bool:
         """Check if we should put initial onset in front of vowel.
-        
+
         As some Thai vowels create ambiguity in pronunciation
         of the word with onset cluster, we might put the prior onset
         in front of these vowels to clarify it.
 
         Ex. เชว, แชว, โชว > ชเว, ชแว, ชโว
         """
-        if (self.option['clear_vowel']
-                and len(self.onset['input']) == 2
-                and (self.option['clear_vowel_onset'] == 'all'
-                or (self.option['clear_vowel_onset'] == 'not_true_cluster'
-                and self.onset['input'] not in CLUSTERS))
-                and (self.option['clear_vowel_tone_mark']
-                or (not self.option['clear_vowel_tone_mark']
-                and not self.tone_mark))
+        if (self._clear_vowel
+                and len(onset) == 2
+                and (self._clear_vowel_all
+                or (self._clear_vowel_not_true_cluster
+                and onset not in CLUSTERS))
+                and (self._clear_vowel_tone_mark or not tone_mark)
                 ):
             return True
         else:
             return False
 
-    def _join_onset_vowel(self, index_after_vowel: int) -> str:
-        """Join onsets and vowel according to the index provided."""
-        combined_onset = self._join_onset()
-        index_after_vowel = self._find_new_index(index_after_vowel)
+    def _join_onset_vowel(
+            self,
+            index_after_vowel: int,
+            onset: str,
+            used_index: int,
+            onset_form: str,
+            vowel_form: str,
+            tone_mark: str) -> List[str]:
+        """Join onsets, vowel and tone marker according to the index provided.
+
+        Return the parts to be joined with the coda.
+        """
+        combined_onset = self._join_onset(onset, used_index, onset_form)
+        index_after_vowel = self._find_new_index(
+            index_after_vowel, used_index, onset_form)
 
-        before_vowel = self._combine_diacritic(
-            combined_onset[:index_after_vowel]
-        )
+        before_vowel = combined_onset[:index_after_vowel]
         after_vowel = combined_onset[index_after_vowel:]
-        if len(after_vowel) > 1:
-            if (len(self.onset['form']) == 2
-                and self.option['onset_style_apply'] == 'not_h'):
-                diacritic_index = -2
-            else:
-                diacritic_index = -1
-            after_vowel = ''.join([
-                self._combine_diacritic(after_vowel[:diacritic_index]),
-                after_vowel[diacritic_index:]
-            ])
-        
-        combined = ''.join([
-            before_vowel,
-            self.vowel['form'].replace('-', after_vowel)
-        ])
-        return combined
+        if not self._onset_plain:
+            before_vowel = self._combine_diacritic(before_vowel)
+            if len(after_vowel) > 1:
+                if (len(onset_form) == 2
+                    and self._diacritic_not_h):
+                    diacritic_index = -2
+                else:
+                    diacritic_index = -1
+                after_vowel = ''.join([
+                    self._combine_diacritic(after_vowel[:diacritic_index]),
+                    after_vowel[diacritic_index:]
+                ])
+
+        vowel_parts = self._find_vowel_parts(vowel_form, tone_mark)
+        if vowel_parts is None:
+            vowel_form = self._delete_taikhuu(vowel_form, tone_mark)
+            vowel_form = vowel_form.replace('-', after_vowel)
+            return [before_vowel, vowel_form.replace('+', tone_mark)]
+        before_onset, before_tone_mark, after_tone_mark = vowel_parts
+        return [before_vowel, before_onset, after_vowel, before_tone_mark,
+            tone_mark, after_tone_mark]
+
+    @staticmethod
+    def _find_vowel_parts(
+            vowel_form: str, tone_mark: str) -> Optional[Tuple[str, str, str]]:
+        """Return split vowel form from _VOWEL_FORM_PARTS.
+
+        Mai taikhuu is deleted if there's also a tone marker.
+        """
+        form_parts = _VOWEL_FORM_PARTS.get(vowel_form)
+        if form_parts is None:
+            form_parts = _find_vowel_form_parts(vowel_form)
+        return form_parts[1] if tone_mark else form_parts[0]
 
-    def _join_onset(self) -> str:
+    @staticmethod
+    def _join_onset(onset: str, used_index: int, onset_form: str) -> str:
         """Join the form of main onset with other onsets."""
-        prior = self.onset['input'][:self.onset['used_index']]
-        latter = self.onset['input'][self.onset['used_index'] + 1:]
-        if self.onset['used_index'] == -1:
+        prior = onset[:used_index]
+        latter = onset[used_index + 1:]
+        if used_index == -1:
             latter = ''
         combined_onset = ''.join([
             prior,
-            self.onset['form'],
+            onset_form,
             latter])
         return combined_onset
 
-    def _find_new_index(self, index_after_vowel: int) -> int:
+    @staticmethod
+    def _find_new_index(
+            index_after_vowel: int, used_index: int, onset_form: str) -> int:
         """Shift index leftward if ห นำ is used."""
-        if (len(self.onset['form']) == 2
-                and self.onset['used_index'] >= index_after_vowel
+        if (len(onset_form) == 2
+                and used_index >= index_after_vowel
                 ):
             index_after_vowel -= 1
         return index_after_vowel
 
     def _combine_diacritic(self, content: str) -> str:
         """Combine diacritic to the onset.
-        
+
         If option specifies that we should add diacritic to onset,
         add diacritic to every character in onset except the last one.
         """
-        if self.option['onset_style'] in ['plain']:
+        style_id, diacritic = self._onset_style
+        if style_id == _STYLE_PLAIN:
             return content
-        if self.option['onset_style'] in ['phinthu', 'yaamakkaan', 'kaaran']:
-            diacritic = DIACRITICS[f"{self.option['onset_style']}"]
+        if style_id == _STYLE_EVERY_CHAR:
             return self._add_diacritic(content, diacritic)
         raise ValueError('onset_style not recognized')
 
@@ -516,7 +669,7 @@ class SpellWord:
     def _add_diacritic(chars: str, diacritic: str) -> str:
         """Add diacritic to every character."""
         if chars:
-            chars = ''.join([''.join([x, diacritic]) for x in chars])
+            chars = diacritic.join(chars) + diacritic
         return chars
 
     @staticmethod
@@ -526,71 +679,166 @@ class SpellWord:
             chars = ''.join([chars, diacritic])
         return chars
 
-    def _combine_coda(self) -> str:
+    def _combine_coda(
+            self,
+            silent_before: str,
+            coda: str,
+            silent_after: str) -> List[str]:
         """Combine coda section: silent before, coda, silent after."""
-        self.silent_before = self._combine_diacritic_coda(
-            self.silent_before, 'silent_before')
-        self.coda = self._combine_diacritic_coda(
-            self.coda, 'coda')
-        self.silent_after = self._combine_diacritic_coda(
-            self.silent_after, 'silent_after')
-        combined_coda = ''.join([
-            self.silent_before,
-            self.coda,
-            self.silent_after
-        ])
-        return combined_coda
+        if self._coda_plain:
+            return [silent_before, coda, silent_after]
+        return [
+            self._combine_diacritic_coda(silent_before, 'silent_before'),
+            self._combine_diacritic_coda(coda, 'coda'),
+            self._combine_diacritic_coda(silent_after, 'silent_after')
+        ]
 
     def _combine_diacritic_coda(self, content: str, name: str) -> str:
         """Combine coda section with diacritic, depending on option."""
-        style = f'{name}_style'
-        if self.option[style] in ['plain']:
+        style_id, diacritic = self._coda_styles[name]
+        if style_id == _STYLE_PLAIN:
             return content
-        elif self.option[style] in ['hide'] and name != 'coda':
+        elif style_id == _STYLE_HIDE:
             return ''
-        elif self.option[style] in [
-                'phinthu', 'yaamakkaan', 'kaaran']:
-            diacritic = DIACRITICS[f'{self.option[style]}']
-            if self.option[style] in ['phinthu', 'yaamakkaan']:
-                add_method = self._add_diacritic
-            elif self.option[style] in ['kaaran']:
-                add_method = self._add_diacritic_last
-            return add_method(content, diacritic)
+        elif style_id == _STYLE_EVERY_CHAR:
+            return self._add_diacritic(content, diacritic)
+        elif style_id == _STYLE_LAST_CHAR:
+            return self._add_diacritic_last(content, diacritic)
         else:
-            raise ValueError(f'{style} not recognized')
+            raise ValueError(f'{name}_style not recognized')
 
     def all_tone(self, **word: Any) -> List[str]:
         """Return all five tone versions of the word.
         
         See parameters from spell_out."""
-        result = []
-        for tone_num in range(0, 5):
-            word['tone'] = tone_num
-            result.append(self.spell_out(**word))
-        return result
+        word.pop('tone', None)
+        self._check_option()
+        if self._option_key is None:
+            return list(self._all_tone(**word))
+        return list(_all_tone_core(self._option_key, **word))
+
+def _create_tone_info(
+        ) -> Dict[Tuple[int, str, bool, str], Tuple[bool, str]]:
+    """Return TONES rule of every (tone, onset class, checked, length).
+
+    The rule is resolved to (use pair onset, tone marker character),
+    so finding it doesn't format the tone phrase for every word.
+    """
+    result: Dict[Tuple[int, str, bool, str], Tuple[bool, str]] = {}
+    for tone, rules in TONES.items():
+        for consonant_class in set(CONSONANT_CLASS.values()):
+            onset_class = consonant_class
+            if onset_class in ['low_pair', 'low_single']:
+                onset_class = 'low'
+            for checked in [False, True]:
+                alive_dead = 'dead' if checked else 'alive'
+                for length in ['short', 'long']:
+                    pair, tone_marker = rules[find_tone_phrase(
+                        onset_class, alive_dead, length)]
+                    result[(tone, consonant_class, checked, length)] = (
+                        pair == 'pair', TONE_MARKERS.get(tone_marker, ''))
+    return result
+
+TONE_INFO: Dict[Tuple[int, str, bool, str], Tuple[bool, str]] = (
+    _create_tone_info())
+
+def _resolve_style(name: str, style: str) -> Tuple[int, str]:
+    """Return style id and diacritic of the style option of name.
 
-def find_vowel_pair(vowel: str) -> str:
-    """Return vowel length pair."""
-    pair = VOWELS[vowel]['pair']
-    if not pair:
-        pair = vowel
-    return pair
-
-def find_vowel_length(vowel: str) -> str:
-    """Return vowel length ('short' or 'long')."""
-    return VOWELS[vowel]['length']
-
-def find_letter_list() -> Dict[str, List[str]]:
-    """Return all consonants, vowels and true clusters."""
-    result = {
-        'consonants': list(CONSONANTS.keys()),
-        'vowels': list(VOWELS.keys()),
-        'true clusters': list(CLUSTERS)}
+    name is 'onset' or one of _CODA_SECTIONS. Onset diacritic is added
+    to every character, and only silent consonants can be hidden.
+    """
+    if style == 'plain':
+        return _STYLE_PLAIN, ''
+    if style == 'hide' and name in ['silent_before', 'silent_after']:
+        return _STYLE_HIDE, ''
+    if style in _DIACRITIC_STYLES:
+        if style == 'kaaran' and name != 'onset':
+            return _STYLE_LAST_CHAR, DIACRITICS[style]
+        return _STYLE_EVERY_CHAR, DIACRITICS[style]
+    return _STYLE_NOT_RECOGNIZED, ''
+
+def _split_vowel_form(vowel_form: str) -> Optional[Tuple[str, str, str]]:
+    """Split vowel form at the consonant (-) and tone marker (+) position.
+
+    Return None if the form doesn't have exactly one - followed by
+    exactly one +.
+    """
+    before_onset, dash, after_onset = vowel_form.partition('-')
+    if (not dash or '-' in after_onset or '+' in before_onset
+            or after_onset.count('+') != 1):
+        return None
+    before_tone_mark, _, after_tone_mark = after_onset.partition('+')
+    return before_onset, before_tone_mark, after_tone_mark
+
+def _find_vowel_form_parts(vowel_form: str) -> Tuple[
+        Optional[Tuple[str, str, str]], Optional[Tuple[str, str, str]]]:
+    """Return split vowel form, as is and without mai taikhuu."""
+    return (_split_vowel_form(vowel_form),
+        _split_vowel_form(vowel_form.replace(DIACRITICS['mai_taikhuu'], '')))
+
+_VOWEL_FORM_PARTS: Dict[str, Tuple[
+        Optional[Tuple[str, str, str]], Optional[Tuple[str, str, str]]]] = {
+    form: _find_vowel_form_parts(form)
+    for form in [*VOWEL_FORM_NO_CODA.values(), *VOWEL_FORM_WITH_CODA.values()]
+    if form}
+
+def _create_vowel_coda_resolved(
+        use_pair: bool) -> Dict[str, Tuple[str, str, bool]]:
+    """Return how every vowel is spelled when there is a coda.
+
+    The result is (vowel used, vowel form, if coda is changed to silent
+    after). Vowels without coda form are resolved as in
+    SpellWord._deal_empty_vowel, using the pair if use_pair is True.
+    Vowels whose pair can't be found are left to _deal_empty_vowel.
+    """
+    result: Dict[str, Tuple[str, str, bool]] = {}
+    for vowel, vowel_form in VOWEL_FORM_WITH_CODA.items():
+        if vowel_form:
+            result[vowel] = (vowel, vowel_form, False)
+        elif not use_pair:
+            result[vowel] = (vowel, VOWEL_FORM_NO_CODA[vowel], True)
+        elif VOWEL_PAIR[vowel] in VOWEL_FORM_WITH_CODA:
+            pair = VOWEL_PAIR[vowel]
+            result[vowel] = (pair, VOWEL_FORM_WITH_CODA[pair], False)
     return result
 
-def _consonant_by_property(property: str, property_name: str) -> List[str]:
-    """Return list of consonant with provided properties.
-    
-    Ex. _consonant_by_property('coda_class', 'alive')
+_VOWEL_CODA_PAIR: Dict[str, Tuple[str, str, bool]] = (
+    _create_vowel_coda_resolved(True))
+_VOWEL_CODA_SILENT: Dict[str, Tuple[str, str, bool]] = (
+    _create_vowel_coda_resolved(False))
+
+def _copy_option(option: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return a copy of option with its dict values copied too."""
+    return {key: dict(value) if isinstance(value, dict) else value
+        for key, value in option.items()}
+
+_DEFAULT_OPTION_KEY: Final = _freeze_pref(_DEFAULT_PREF)
+
+@lru_cache(maxsize=4096)
+def _spell_core(
+        option_key: FrozenPref,
+        onset: str,
+        vowel: str,
+        silent_before: str,
+        coda: str,
+        silent_after: str,
+        tone: int) -> str:
+    """Spell out the word with the option frozen by _freeze_pref."""
+    return _spell_word(option_key)._spell_out(onset, vowel, silent_before,
+        coda, silent_after, tone)
+
+@lru_cache(maxsize=4096)
+def _all_tone_core(
+        option_key: FrozenPref,
+        **word: str) -> Tuple[str, ...]:
+    """Spell out all five tones with the option frozen by _freeze_pref."""
+    return _spell_word(option_key)._all_tone(**word)
+
+@lru_cache(maxsize=64)
+def _spell_word(option_key: FrozenPref) -> SpellWord:
+    """Return SpellWord made from the option frozen by _freeze_pref.
+
+    SpellWord doesn't keep the word being spelled, so it can be shared.
     """
-    return [x for x in CONSONANTS if CONSONANTS[x][property] == property_name]
\ No newline at end of file
+    return SpellWord(**_thaw_pref(option_key))
@@ -1,26 +1,34 @@
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (Any, Dict, Hashable, List, Mapping, Optional, Tuple,
+    cast)
 
-from khanaa.thai_script import (CLUSTERS, CONSONANTS, TONE_NOT_AVAILABLE,
-    VOWELS, TONES)
+from khanaa.thai_script import (CLUSTERS, CONSONANT_CLASS,
+    CONSONANT_CODA_CLASS, CONSONANTS, TONE_NOT_AVAILABLE, VOWELS,
+    VOWEL_LENGTH, VOWEL_PAIR, VOWEL_SOUND_CODA, TONES)
 
 def find_vowel_pair(vowel: str) -> str:
     """Return vowel length pair."""
-    pair = VOWELS[vowel]['pair']
+    pair = VOWEL_PAIR[vowel]
     if not pair:
         pair = vowel
     return pair
 
 def find_vowel_length(vowel: str) -> str:
     """Return vowel length ('short' or 'long')."""
-    return VOWELS[vowel]['length']
-
-def find_letter_list() -> Dict[str, List[str]]:
-    """Return all consonants, vowels and true clusters."""
-    result: Dict[str, List[str]] = {
-        'consonants': list(CONSONANTS.keys()),
-        'vowels': list(VOWELS.keys()),
-        'true clusters': list(CLUSTERS)}
-    return result
+    return VOWEL_LENGTH[vowel]
+
+LETTER_LIST: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'consonants': tuple(CONSONANTS),
+    'vowels': tuple(VOWELS),
+    'true clusters': tuple(sorted(CLUSTERS))})
+
+def find_letter_list() -> Mapping[str, Tuple[str, ...]]:
+    """Return all consonants, vowels and true clusters.
+
+    The result is read-only and shared, so it isn't built on every call.
+    """
+    return LETTER_LIST
 
 def letter_by_property(letter_dict: Dict[str, Dict[str, str]],
         property: str, property_name: str) -> List[str]:
@@ -37,14 +45,20 @@ def check_checked(vowel: str, coda: str) -> bool:
     Checked word in Thai:
     - Has no coda, short length (and no hidden coda like ไอ)
     - Has dead class coda"""
+    return _is_checked(VOWEL_LENGTH[vowel], VOWEL_SOUND_CODA[vowel], coda)
+
+def _is_checked(length: str, sound_coda: str, coda: str) -> bool:
+    """Check if the word is checked from the vowel properties.
+
+    See check_checked."""
     checked: bool = False
     if (not coda
-            and VOWELS[vowel]['length'] == 'short'
-            and not VOWELS[vowel]['sound_coda']
+            and length == 'short'
+            and not sound_coda
         ):
         checked = True
     elif (coda
-            and CONSONANTS[coda]['coda_class'] == 'dead'
+            and CONSONANT_CODA_CLASS[coda] == 'dead'
         ):
         checked = True
     return checked
@@ -54,16 +68,21 @@ def find_tone_data(onset: str, vowel: str,
     """Return onset_class, alive_dead, length.
     
     onset accepts only one character."""
-    onset_class: str = CONSONANTS[onset]['class']
+    onset_class: str = CONSONANT_CLASS[onset]
     if onset_class in ['low_pair', 'low_single']:
         onset_class = 'low'
-    alive_dead: str = 'dead' if check_checked(
-        vowel, coda) else 'alive'
-    length: str = VOWELS[vowel]['length']
+    length: str = VOWEL_LENGTH[vowel]
+    alive_dead: str = 'dead' if _is_checked(
+        length, VOWEL_SOUND_CODA[vowel], coda) else 'alive'
     return onset_class, alive_dead, length
 
-def find_tone_phrase(onset_class: str, alive_dead: str, length: str):
-    """Return word detail in format that is used in TONES."""
+@lru_cache(maxsize=64)
+def find_tone_phrase(onset_class: str, alive_dead: str, length: str) -> str:
+    """Return word detail in format that is used in TONES.
+
+    There are only a few combinations, so the phrases are cached
+    instead of formatted for every word.
+    """
     word_detail: str
     if onset_class in ['high', 'low'] and alive_dead == 'dead':
         word_detail = f'{onset_class} {length} {alive_dead}'
@@ -82,21 +101,27 @@ def find_tone(onset: str, vowel: str, coda: str = '',
 
     return -1 (not valid), 0 (สามัญ), 1 (เอก), 2 (โท), 3 (ตรี), 4 (จัตวา)
     """
-    tone_num: int = -1
     onset_class, alive_dead, length = find_tone_data(onset, vowel, coda)
     if h_present and onset_class == 'low':
         onset_class = 'high'
     tone_info: str = find_tone_phrase(onset_class, alive_dead, length)
+    return TONE_BY_MARKER.get((tone_info, tone_marker), -1)
 
-    for tone in TONES:
-        if (tone_info in TONES[tone]
-                and not (tone in TONE_NOT_AVAILABLE
-                    and tone_info in TONE_NOT_AVAILABLE[tone])
-                and TONES[tone][tone_info] == ['', tone_marker]):
-            tone_num = tone
-            break
+def _create_tone_by_marker() -> Dict[Tuple[str, str], int]:
+    """Return tone of each (tone phrase, tone marker) without pair onset.
 
-    return tone_num
+    The lowest available tone is used if more than one match.
+    """
+    result: Dict[Tuple[str, str], int] = {}
+    for tone, rules in TONES.items():
+        for tone_info, (pair, tone_marker) in rules.items():
+            if (not pair
+                    and not (tone in TONE_NOT_AVAILABLE
+                        and tone_info in TONE_NOT_AVAILABLE[tone])):
+                result.setdefault((tone_info, tone_marker), tone)
+    return result
+
+TONE_BY_MARKER: Dict[Tuple[str, str], int] = _create_tone_by_marker()
 
 def parse_ipa_string(ipa: str) -> List[Dict[str, str]]:
     """Turn IPA string to a list containing dicts representing each syllable.
@@ -118,4 +143,29 @@ def parse_ipa_string(ipa: str) -> List[Dict[str, str]]:
         final = None if ipa_list[-2] not in ['w', 'j', 'm', 'n', 'ŋ', 'p̚', 't̚', 'k̚'] else ipa_list[-2]
         tone = ipa_list[-1]
         result.append({'initial': initial, 'glide': glide, 'vowel': vowel, 'final': final, 'tone': tone})
-    return result
\ No newline at end of file
+    return result
+
+# pref frozen by _freeze_pref: sorted (key, type of value, frozen value)
+FrozenPref = Tuple[Tuple[str, type, Hashable], ...]
+
+def _freeze_pref(pref: Mapping[str, Any]) -> Optional[FrozenPref]:
+    """Return pref as hashable sorted items, or None if it can't be hashed.
+
+    The type of each value is kept, so True and 1 don't give the same
+    key, and only values that were dicts are turned back to dicts by
+    _thaw_pref.
+    """
+    try:
+        frozen: FrozenPref = tuple(sorted(
+            (key, dict, tuple(sorted(value.items())))
+            if isinstance(value, dict) else (key, type(value), value)
+            for key, value in pref.items()))
+        hash(frozen)
+    except TypeError:
+        return None
+    return frozen
+
+def _thaw_pref(frozen: FrozenPref) -> Dict[str, Any]:
+    """Return pref frozen by _freeze_pref as a new dict."""
+    return {key: dict(cast(Tuple[Tuple[str, Any], ...], value))
+        if kind is dict else value for key, kind, value in frozen}
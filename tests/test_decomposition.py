@@ -1,5 +1,7 @@
 import unittest
+import unicodedata
 from khanaa import spelling_decompose
+from khanaa.thai_script import VOWELS
 
 GENERAL = {
     'เขียน': {
@@ -74,5 +76,12 @@ class TestSpellingDecompose(unittest.TestCase):
             result = spelling_decompose(case)
             self.assertEqual(result, GENERAL[case])
 
+    def test_vowel_form_normalized(self):
+        # vowel regexes are built from the forms as they are
+        for vowel in VOWELS:
+            for form in ('form_no_coda', 'form_with_coda'):
+                text = VOWELS[vowel][form]
+                self.assertEqual(text, unicodedata.normalize('NFC', text))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
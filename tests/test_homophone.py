@@ -1,7 +1,7 @@
 import unittest
 from khanaa import Kham
 
-GENERAL = [
+GENERAL = (
     ({'onset': 'ค', 'vowel': 'โอะ', 'coda': 'น'},
         ['คญ', 'คณ', 'คน', 'คร', 'คล', 'คฬ', 'ฅญ', 'ฅณ', 'ฅน', 'ฅร', 'ฅล',
             'ฅฬ', 'ฆญ', 'ฆณ', 'ฆน', 'ฆร', 'ฆล', 'ฆฬ']),
@@ -10,7 +10,7 @@ GENERAL = [
     ({'onset': 'สว', 'vowel': 'อิ', 'coda': 'ต', 'silent_after': 'ช'},
         ['สวิจ', 'สวิช', 'สวิซ', 'สวิฌ', 'สวิฎ', 'สวิฏ', 'สวิฐ', 'สวิฑ', 'สวิฒ', 'สวิด',
             'สวิต', 'สวิถ', 'สวิท', 'สวิธ', 'สวิศ', 'สวิษ', 'สวิส'])
-]
+)
 
 class TestHomophone(unittest.TestCase):
 
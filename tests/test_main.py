@@ -1,7 +1,7 @@
 import unittest
 from khanaa import Kham
 
-GENERAL = [
+GENERAL = (
     ({'onset': 'ส', 'vowel': 'เอีย', 'coda': 'ง', 'tone': -1},
     'เสียง'),
     ({'onset': 'ต', 'vowel': 'อะ', 'coda': 'ง', 'tone': 2},
@@ -19,10 +19,14 @@ GENERAL = [
     ({'onset': 'คว', 'vowel': 'เอ', 'coda': 'น'},
     'เควน'),
     ({'onset': 'สตร', 'vowel': 'เอ', 'coda': 'ส'},
-    'สเตรส')
-]
+    'สเตรส'),
+    # mai taikhuu is deleted from the whole word if there's a tone mark
+    ({'onset': 'ก', 'vowel': 'อะ', 'coda': 'ก', 'silent_after': 'ก็',
+    'tone': 2},
+    'กั้กก์')
+)
 
-ONSET_TONE = [
+ONSET_TONE = (
     # alive mid, high, paired low, single low onsets
     ({'onset': 'ก', 'vowel': 'อา'},
     ['กา', 'ก่า', 'ก้า', 'ก๊า', 'ก๋า']),
@@ -49,9 +53,9 @@ ONSET_TONE = [
     ({'onset': 'ค', 'vowel': 'อะ', 'coda': 'บ'},
     ['', 'ขับ', 'คั่บ', 'คับ', 'คั๋บ']),
     ({'onset': 'ง', 'vowel': 'อะ', 'coda': 'บ'},
-    ['', 'หงับ', 'งั่บ', 'งับ', 'งั๋บ'])]
+    ['', 'หงับ', 'งั่บ', 'งับ', 'งั๋บ']))
 
-ONSET_CLUSTER = [
+ONSET_CLUSTER = (
     # mid & single low
     ({'onset': 'กว', 'vowel': 'อา'},
     ['กวา', 'กว่า', 'กว้า', 'กว๊า', 'กว๋า']),
@@ -67,9 +71,9 @@ ONSET_CLUSTER = [
     # three consonants
     ({'onset': 'สตร', 'vowel': 'อา'},
     ['สตรา', 'สตร่า', 'สตร้า', 'สตร๊า', 'สตร๋า'])
-]
+)
 
-SETTING_STYLE = [
+SETTING_STYLE = (
     ({'onset_style': 'kaaran'},
     {'onset': 'ทซ', 'vowel': 'อุ'},
     'ท์ซุ'),
@@ -98,9 +102,9 @@ SETTING_STYLE = [
     'สเวิล'),
     ({'vowel_length': 'short'},
     {'onset': 'ม', 'vowel': 'อา', 'coda': 'น'},
-    'มัน')]
+    'มัน'))
 
-SETTING_FORM = [
+SETTING_FORM = (
     ({'vowel_no_coda': 'pair'},
     {'onset': 'อ', 'vowel': 'เอียะ', 'coda': 'น'},
     'เอียน'),
@@ -122,9 +126,9 @@ SETTING_FORM = [
     ({'vowel_length': 'short', 'vowel_pair_form': {'อาย': 'ไอ'}},
     {'onset': 'อ', 'vowel': 'อาย'},
     'ไอ')
-]
+)
 
-SETTING_PLACING = [
+SETTING_PLACING = (
     ({'clear_vowel_onset': 'not_true_cluster'},
     {'onset': 'คว', 'vowel': 'เอ'},
     'เคว'),
@@ -137,27 +141,27 @@ SETTING_PLACING = [
     ({'clear_vowel_onset': 'all', 'clear_vowel_tone_mark': True},
     {'onset': 'คว', 'vowel': 'เอ', 'tone': 2},
     'คเว่')
-]
+)
 
-SETTING_LS = [
+SETTING_LS = (
     ({'obvious_low_singles': False},
     {'onset': 'ลว', 'vowel': 'อี'},
     ['ลวี', 'หลวี่', 'ลวี่', 'ลวี้', 'หลวี']),
     ({'obvious_low_singles': True},
     {'onset': 'ลว', 'vowel': 'อี'},
     ['ลวี', 'ลหวี่', 'ลวี่', 'ลวี้', 'ลหวี'])
-]
+)
 
-SETTING_HLS = [
+SETTING_HLS = (
     ({'obvious_h_low_single': False},
     {'onset': 'ฮว', 'vowel': 'เอีย', 'coda': 'น'},
     ['ฮเวียน', 'เหวี่ยน', 'เฮวี่ยน', 'เฮวี้ยน', 'หเวียน']),
     ({'obvious_h_low_single': True},
     {'onset': 'ฮว', 'vowel': 'เอีย', 'coda': 'น'},
     ['ฮเวียน', 'ฮเหวี่ยน', 'เฮวี่ยน', 'เฮวี้ยน', 'ฮเหวียน'])
-]
+)
 
-SETTING_SPLIT = [
+SETTING_SPLIT = (
     ({'split_true_cluster': False},
     {'onset': 'กร', 'vowel': 'อุ', 'coda': 'น', 'tone': 1},
     'กรุ่น'),
@@ -176,16 +180,16 @@ SETTING_SPLIT = [
     ({'split_leading_con': True},
     {'onset': 'สล', 'vowel': 'โอ', 'silent_before': 'ว', 'tone': 0},
     'สโลว์')
-]
+)
 
-SETTING_H_THOO = [
+SETTING_H_THOO = (
     ({'low_single_h_thoo': False},
     {'onset': 'ม', 'vowel': 'อะ', 'coda': 'น', 'tone': 2},
     'มั่น'),
     ({'low_single_h_thoo': True},
     {'onset': 'ม', 'vowel': 'อะ', 'coda': 'น', 'tone': 2},
     'หมั้น')
-]
+)
 
 TO_IPA = (
     ({},
@@ -223,7 +227,7 @@ TO_RTGS = (
     'pra'),
 )
 
-DONEE_END = [
+DONEE_END = (
     ({},
     {'onset': 'ต', 'vowel': 'อา'},
     True),
@@ -236,9 +240,9 @@ DONEE_END = [
     ({'silent_before_style': 'plain'},
     {'onset': 'อ', 'vowel': 'อา', 'silent_before': 'ร'},
     False)
-]
+)
 
-DONOR_END = [
+DONOR_END = (
     ({},
     {'onset': 'ต', 'vowel': 'อา', 'coda': 'ก'},
     True),
@@ -251,16 +255,16 @@ DONOR_END = [
     ({'silent_before_style': 'plain'},
     {'onset': 'อ', 'vowel': 'อา', 'silent_before': 'ร'},
     True)
-]
+)
 
-DONOR_START = [
+DONOR_START = (
     ({},
     {'onset': 'กล', 'vowel': 'โอะ', 'coda': 'ม'},
     True),
     ({'clear_vowel': False},
     {'onset': 'คว', 'vowel': 'เอ'},
     False)
-]
+)
 
 class TestSpellWord(unittest.TestCase):
 
@@ -299,7 +303,7 @@ class TestSpellWord(unittest.TestCase):
             spell = Kham(**case[0], **case[1])
             self.assertEqual(spell.all_tone(), case[2])
 
-    def test_setting_ls(self):
+    def test_setting_hls(self):
         for case in SETTING_HLS:
             spell = Kham(**case[0], **case[1])
             self.assertEqual(spell.all_tone(), case[2])
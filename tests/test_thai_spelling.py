@@ -1,7 +1,7 @@
 import unittest
 from khanaa import SpellWord
 
-GENERAL = [
+GENERAL = (
     ({'onset': 'ส', 'vowel': 'เอีย', 'coda': 'ง', 'tone': -1},
     'เสียง'),
     ({'onset': 'ต', 'vowel': 'อะ', 'coda': 'ง', 'tone': 2},
@@ -20,9 +20,9 @@ GENERAL = [
     'เควน'),
     ({'onset': 'สตร', 'vowel': 'เอ', 'coda': 'ส'},
     'สเตรส')
-]
+)
 
-ONSET_TONE = [
+ONSET_TONE = (
     # alive mid, high, paired low, single low onsets
     ({'onset': 'ก', 'vowel': 'อา'},
     ['กา', 'ก่า', 'ก้า', 'ก๊า', 'ก๋า']),
@@ -49,9 +49,9 @@ ONSET_TONE = [
     ({'onset': 'ค', 'vowel': 'อะ', 'coda': 'บ'},
     ['คับ', 'ขับ', 'คั่บ', 'คับ', 'คับ']),
     ({'onset': 'ง', 'vowel': 'อะ', 'coda': 'บ'},
-    ['งับ', 'หงับ', 'งั่บ', 'งับ', 'งับ'])]
+    ['งับ', 'หงับ', 'งั่บ', 'งับ', 'งับ']))
 
-ONSET_CLUSTER = [
+ONSET_CLUSTER = (
     # mid & single low
     ({'onset': 'กว', 'vowel': 'อา'},
     ['กวา', 'กว่า', 'กว้า', 'กว๊า', 'กว๋า']),
@@ -67,9 +67,9 @@ ONSET_CLUSTER = [
     # three consonants
     ({'onset': 'สตร', 'vowel': 'อา'},
     ['สตรา', 'สตร่า', 'สตร้า', 'สตร๊า', 'สตร๋า'])
-]
+)
 
-SETTING_STYLE = [
+SETTING_STYLE = (
     ({'onset_style': 'kaaran'},
     {'onset': 'ทซ', 'vowel': 'อุ'},
     'ท์ซุ'),
@@ -98,9 +98,9 @@ SETTING_STYLE = [
     'สเวิล'),
     ({'vowel_length': 'short'},
     {'onset': 'ม', 'vowel': 'อา', 'coda': 'น'},
-    'มัน')]
+    'มัน'))
 
-SETTING_FORM = [
+SETTING_FORM = (
     ({'vowel_no_coda': 'pair'},
     {'onset': 'อ', 'vowel': 'เอียะ', 'coda': 'น'},
     'เอียน'),
@@ -122,9 +122,9 @@ SETTING_FORM = [
     ({'vowel_length': 'short', 'vowel_pair_form': {'อาย': 'ไอ'}},
     {'onset': 'อ', 'vowel': 'อาย'},
     'ไอ')
-]
+)
 
-SETTING_PLACING = [
+SETTING_PLACING = (
     ({'clear_vowel_onset': 'not_true_cluster'},
     {'onset': 'คว', 'vowel': 'เอ'},
     'เคว'),
@@ -137,67 +137,113 @@ SETTING_PLACING = [
     ({'clear_vowel_onset': 'all', 'clear_vowel_tone_mark': True},
     {'onset': 'คว', 'vowel': 'เอ', 'tone': 2},
     'คเว่')
-]
+)
 
-SETTING_LS = [
+SETTING_LS = (
     ({'obvious_low_singles': False},
     {'onset': 'ลว', 'vowel': 'อี'},
     ['ลวี', 'หลวี่', 'ลวี่', 'ลวี้', 'หลวี']),
     ({'obvious_low_singles': True},
     {'onset': 'ลว', 'vowel': 'อี'},
     ['ลวี', 'ลหวี่', 'ลวี่', 'ลวี้', 'ลหวี'])
-]
+)
 
-SETTING_HLS = [
+SETTING_HLS = (
     ({'obvious_h_low_single': False},
     {'onset': 'ฮว', 'vowel': 'เอีย', 'coda': 'น'},
     ['ฮเวียน', 'เหวี่ยน', 'เฮวี่ยน', 'เฮวี้ยน', 'หเวียน']),
     ({'obvious_h_low_single': True},
     {'onset': 'ฮว', 'vowel': 'เอีย', 'coda': 'น'},
     ['ฮเวียน', 'ฮเหวี่ยน', 'เฮวี่ยน', 'เฮวี้ยน', 'ฮเหวียน'])
-]
+)
+
+# SpellWord of each setting, shared by every test
+_SPELLS = {}
+
+def _make_spell(setting):
+    """Return SpellWord of the setting, made once per setting."""
+    key = repr(sorted(setting.items()))
+    if key not in _SPELLS:
+        _SPELLS[key] = SpellWord(**setting)
+    return _SPELLS[key]
 
 class TestSpellWord(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls._default = _make_spell({})
+
+    def _get_spell(self, setting):
+        return _make_spell(setting)
+
     def test_general(self):
-        spell = SpellWord()
-        for case in GENERAL:
-            self.assertEqual(spell.spell_out(**case[0]), case[1])
+        spell = self._default
+        for params, expected in GENERAL:
+            with self.subTest(params=params):
+                self.assertEqual(spell.spell_out(**params), expected)
+
+    def _assert_all_tone(self, cases):
+        """Compare all_tone of every case at once.
+
+        Cases are only checked one by one (for the failing ones)
+        if the results differ.
+        """
+        spell = self._default
+        actual = tuple(tuple(spell.all_tone(**params))
+            for params, _ in cases)
+        if actual == tuple(tuple(expected) for _, expected in cases):
+            return
+        for params, expected in cases:
+            with self.subTest(params=params):
+                self.assertEqual(spell.all_tone(**params), expected)
 
     def test_onset_tone(self):
-        spell = SpellWord()
-        for case in ONSET_TONE:
-            self.assertEqual(spell.all_tone(**case[0]), case[1])
+        self._assert_all_tone(ONSET_TONE)
 
     def test_onset_cluster(self):
-        spell = SpellWord()
-        for case in ONSET_CLUSTER:
-            self.assertEqual(spell.all_tone(**case[0]), case[1])
+        self._assert_all_tone(ONSET_CLUSTER)
 
     def test_setting_style(self):
-        for case in SETTING_STYLE:
-            spell = SpellWord(**case[0])
-            self.assertEqual(spell.spell_out(**case[1]), case[2])
+        for setting, params, expected in SETTING_STYLE:
+            with self.subTest(setting=setting, params=params):
+                spell = self._get_spell(setting)
+                self.assertEqual(spell.spell_out(**params), expected)
 
     def test_setting_form(self):
-        for case in SETTING_FORM:
-            spell = SpellWord(**case[0])
-            self.assertEqual(spell.spell_out(**case[1]), case[2])
+        for setting, params, expected in SETTING_FORM:
+            with self.subTest(setting=setting, params=params):
+                spell = self._get_spell(setting)
+                self.assertEqual(spell.spell_out(**params), expected)
 
     def test_setting_placing(self):
-        for case in SETTING_PLACING:
-            spell = SpellWord(**case[0])
-            self.assertEqual(spell.spell_out(**case[1]), case[2])
+        for setting, params, expected in SETTING_PLACING:
+            with self.subTest(setting=setting, params=params):
+                spell = self._get_spell(setting)
+                self.assertEqual(spell.spell_out(**params), expected)
 
     def test_setting_ls(self):
-        for case in SETTING_LS:
-            spell = SpellWord(**case[0])
-            self.assertEqual(spell.all_tone(**case[1]), case[2])
-
-    def test_setting_ls(self):
-        for case in SETTING_HLS:
-            spell = SpellWord(**case[0])
-            self.assertEqual(spell.all_tone(**case[1]), case[2])
+        for setting, params, expected in SETTING_LS:
+            with self.subTest(setting=setting, params=params):
+                spell = self._get_spell(setting)
+                self.assertEqual(spell.all_tone(**params), expected)
+
+    def test_setting_hls(self):
+        for setting, params, expected in SETTING_HLS:
+            with self.subTest(setting=setting, params=params):
+                spell = self._get_spell(setting)
+                self.assertEqual(spell.all_tone(**params), expected)
+
+    def test_option_change(self):
+        # not shared, as its option is changed
+        spell = SpellWord()
+        word = {'onset': 'ด', 'vowel': 'เออ', 'coda': 'น'}
+        self.assertEqual(spell.spell_out(**word), 'เดิน')
+        spell.option['vowel_coda_form']['เออ'] = 'เ-+อ'
+        self.assertEqual(spell.spell_out(**word), 'เดอน')
+        spell.option['onset_style'] = 'phinthu'
+        self.assertEqual(spell.all_tone(onset='สม', vowel='อา'),
+            SpellWord(onset_style='phinthu').all_tone(onset='สม', vowel='อา'))
+        self.assertEqual(SpellWord().spell_out(**word), 'เดิน')
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file